@@ -3,129 +3,174 @@ Módulo com funções de validação de dados.
 Contém validação de CNPJ usando algoritmo oficial.
 """
 
+import functools
+
 from typing import Optional
 from .layout_constants import CNPJ_TAMANHO, CPF_TAMANHO, CNPJ_VAZIO
 
+# Pesos do Módulo 11 pré-computados (evita o contador decrescente com
+# reset dentro do loop): primeiro e segundo dígito verificador do CNPJ.
+_PESOS_CNPJ_1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CNPJ_2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
 
-def validar_cnpj(cnpj: str) -> bool:
-    """
-    Valida CNPJ usando o algoritmo oficial (Módulo 11).
-    
-    Args:
-        cnpj: CNPJ a ser validado (pode ter ou não formatação)
-    
-    Returns:
-        True se o CNPJ for válido, False caso contrário
-    """
-    # Remove tudo que não é dígito
-    cnpj_limpo = ''.join(filter(str.isdigit, str(cnpj)))
-    
-    # Deve ter exatamente CNPJ_TAMANHO dígitos
-    if len(cnpj_limpo) != CNPJ_TAMANHO:
-        return False
-    
+# CPF composto só de zeros (evita realocar o literal em cada chamada)
+_ZERO_CPF = '0' * CPF_TAMANHO
+
+# Resultados de classificar_documento
+DOCUMENTO_INVALIDO = 0
+DOCUMENTO_CNPJ_VALIDO = 1
+DOCUMENTO_CPF_CONVERTIDO = 2
+
+
+# Memoizados: num lote de NFs os mesmos emitentes/contratantes se repetem
+# em quase todos os registros, então o Módulo 11 roda uma vez por documento
+# distinto e o restante vira um hit de cache
+@functools.lru_cache(maxsize=4096)
+def _checksum_cnpj(cnpj_limpo: str) -> bool:
+    """Valida os dígitos verificadores de um CNPJ já limpo (14 dígitos)."""
     # Verifica se todos os dígitos são iguais (CNPJ inválido)
     if cnpj_limpo == CNPJ_VAZIO or cnpj_limpo == cnpj_limpo[0] * CNPJ_TAMANHO:
         return False
-    
+
     # Calcula primeiro dígito verificador
-    tamanho = len(cnpj_limpo) - 2
-    numeros = cnpj_limpo[:tamanho]
-    digitos = cnpj_limpo[tamanho:]
-    soma = 0
-    pos = tamanho - 7
-    
-    for i in range(tamanho):
-        soma += int(numeros[i]) * pos
-        pos -= 1
-        if pos < 2:
-            pos = 9
-    
+    digitos = cnpj_limpo[-2:]
+    soma = sum((ord(c) - 48) * p for c, p in zip(cnpj_limpo, _PESOS_CNPJ_1))
+
     resultado = soma % 11
     if resultado < 2:
         digito1 = 0
     else:
         digito1 = 11 - resultado
-    
+
     if int(digitos[0]) != digito1:
         return False
-    
+
     # Calcula segundo dígito verificador
-    tamanho += 1
-    numeros = cnpj_limpo[:tamanho]
-    soma = 0
-    pos = tamanho - 7
-    
-    for i in range(tamanho):
-        soma += int(numeros[i]) * pos
-        pos -= 1
-        if pos < 2:
-            pos = 9
-    
+    soma = sum((ord(c) - 48) * p for c, p in zip(cnpj_limpo, _PESOS_CNPJ_2))
+
     resultado = soma % 11
     if resultado < 2:
         digito2 = 0
     else:
         digito2 = 11 - resultado
-    
+
     if int(digitos[1]) != digito2:
         return False
-    
+
     return True
 
 
-def validar_cpf(cpf: str) -> bool:
-    """
-    Valida CPF usando o algoritmo oficial (Módulo 11).
-    
-    Args:
-        cpf: CPF a ser validado (pode ter ou não formatação)
-    
-    Returns:
-        True se o CPF for válido, False caso contrário
-    """
-    # Remove tudo que não é dígito
-    cpf_limpo = ''.join(filter(str.isdigit, str(cpf)))
-    
-    # Deve ter exatamente CPF_TAMANHO dígitos
-    if len(cpf_limpo) != CPF_TAMANHO:
-        return False
-    
+@functools.lru_cache(maxsize=4096)
+def _checksum_cpf(cpf_limpo: str) -> bool:
+    """Valida os dígitos verificadores de um CPF já limpo (11 dígitos)."""
     # Verifica se todos os dígitos são iguais (CPF inválido)
     if cpf_limpo == cpf_limpo[0] * CPF_TAMANHO:
         return False
-    
+
     # Calcula primeiro dígito verificador
     soma = 0
     for i in range(9):
         soma += int(cpf_limpo[i]) * (10 - i)
-    
+
     resto = soma % 11
     if resto < 2:
         digito1 = 0
     else:
         digito1 = 11 - resto
-    
+
     if int(cpf_limpo[9]) != digito1:
         return False
-    
+
     # Calcula segundo dígito verificador
     soma = 0
     for i in range(10):
         soma += int(cpf_limpo[i]) * (11 - i)
-    
+
     resto = soma % 11
     if resto < 2:
         digito2 = 0
     else:
         digito2 = 11 - resto
-    
+
     if int(cpf_limpo[10]) != digito2:
         return False
-    
+
     return True
 
 
+def validar_cnpj(cnpj: str) -> bool:
+    """
+    Valida CNPJ usando o algoritmo oficial (Módulo 11).
+
+    Args:
+        cnpj: CNPJ a ser validado (pode ter ou não formatação)
+
+    Returns:
+        True se o CNPJ for válido, False caso contrário
+    """
+    # Remove tudo que não é dígito
+    cnpj_limpo = ''.join(filter(str.isdigit, str(cnpj)))
+
+    # Deve ter exatamente CNPJ_TAMANHO dígitos
+    if len(cnpj_limpo) != CNPJ_TAMANHO:
+        return False
+
+    return _checksum_cnpj(cnpj_limpo)
+
+
+def validar_cpf(cpf: str) -> bool:
+    """
+    Valida CPF usando o algoritmo oficial (Módulo 11).
+
+    Args:
+        cpf: CPF a ser validado (pode ter ou não formatação)
+
+    Returns:
+        True se o CPF for válido, False caso contrário
+    """
+    # Remove tudo que não é dígito
+    cpf_limpo = ''.join(filter(str.isdigit, str(cpf)))
+
+    # Deve ter exatamente CPF_TAMANHO dígitos
+    if len(cpf_limpo) != CPF_TAMANHO:
+        return False
+
+    return _checksum_cpf(cpf_limpo)
+
+
+def classificar_documento(documento: str) -> int:
+    """
+    Classifica um documento de 14 dígitos em uma única passada.
+
+    Limpa a string uma vez só e roda no máximo dois checksums, evitando o
+    padrão `validar_cnpj` seguido de `is_cpf_convertido` (que refaz limpeza
+    e validação de CPF internamente).
+
+    Args:
+        documento: Documento a ser classificado (pode ter formatação)
+
+    Returns:
+        DOCUMENTO_CNPJ_VALIDO, DOCUMENTO_CPF_CONVERTIDO ou DOCUMENTO_INVALIDO
+    """
+    documento_limpo = ''.join(filter(str.isdigit, str(documento)))
+
+    if len(documento_limpo) != CNPJ_TAMANHO:
+        return DOCUMENTO_INVALIDO
+
+    if _checksum_cnpj(documento_limpo):
+        return DOCUMENTO_CNPJ_VALIDO
+
+    cpf_candidato = documento_limpo[-CPF_TAMANHO:]
+    if _checksum_cpf(cpf_candidato):
+        return DOCUMENTO_CPF_CONVERTIDO
+
+    # Mesmo fallback de is_cpf_convertido: prefixo 000 e não tudo zeros
+    if documento_limpo[:3] == '000' and cpf_candidato != _ZERO_CPF:
+        return DOCUMENTO_CPF_CONVERTIDO
+
+    return DOCUMENTO_INVALIDO
+
+
 def is_cpf_convertido(cnpj: str) -> bool:
     """
     Verifica se um CNPJ é na verdade um CPF convertido (preenchido com zeros à esquerda).
@@ -149,17 +194,13 @@ def is_cpf_convertido(cnpj: str) -> bool:
     cpf_candidato = cnpj_limpo[-11:]
     
     # Se os últimos 11 dígitos formam um CPF válido, então é um CPF convertido
-    if validar_cpf(cpf_candidato):
+    # (o candidato já está limpo; valida direto o checksum)
+    if _checksum_cpf(cpf_candidato):
         return True
     
-    # Fallback: Se começa com 000 e os últimos 11 dígitos são numéricos
-    # (mesmo que não passe na validação rigorosa, pode ser um CPF mal formatado)
-    if cnpj_limpo.startswith('000') and len(cpf_candidato) == CPF_TAMANHO:
-        # Aceita se não for tudo zeros
-        if cpf_candidato != '0' * CPF_TAMANHO:
-            return True
-    
-    return False
+    # Fallback: Se começa com 000 e não é tudo zeros, pode ser um CPF mal
+    # formatado (o comprimento já foi verificado acima).
+    return cnpj_limpo[:3] == '000' and cpf_candidato != _ZERO_CPF
 
 
 def extrair_cpf_de_cnpj_convertido(cnpj: str) -> Optional[str]:
@@ -1,16 +1,39 @@
 """
 Módulo GUI - Interface gráfica para conversão de PDFs SIPROQUIM.
+
+Os submódulos são carregados de forma preguiçosa (PEP 562): importar o
+pacote não paga o custo de inicialização do Tk/App, o que acelera o
+startup de scripts CLI/batch que só precisam de partes isoladas.
 """
 
-from .constants import UIConstants
-from .validators import FormValidator
-from .log_manager import LogManager
-from .log_manager_qt import LogManagerQt
-from .progress_manager import ProgressManager
-from .app import App
-from .app_qt import JanelaConversor, criar_app_qt
+import importlib
+
+# Mapa atributo -> submódulo que o define
+_lazy = {
+    'UIConstants': 'constants',
+    'FormValidator': 'validators',
+    'LogManager': 'log_manager',
+    'LogManagerQt': 'log_manager_qt',
+    'ProgressManager': 'progress_manager',
+    'App': 'app',
+    'JanelaConversor': 'app_qt',
+    'criar_app_qt': 'app_qt',
+}
 
 __all__ = [
     'UIConstants', 'FormValidator', 'LogManager', 'LogManagerQt',
     'ProgressManager', 'App', 'JanelaConversor', 'criar_app_qt',
 ]
+
+
+def __getattr__(name):
+    if name in _lazy:
+        modulo = importlib.import_module('.' + _lazy[name], __name__)
+        valor = getattr(modulo, name)
+        globals()[name] = valor  # cacheia para os próximos acessos
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
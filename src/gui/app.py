@@ -5,9 +5,16 @@ Classe App que gerencia toda a interface do usuário.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
+import queue
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
+import sys
+import time
 import traceback
 import unicodedata
 from datetime import datetime
@@ -35,6 +42,10 @@ except ImportError:
     # Se falhar, tenta importar de src.config
     from src.config import FiliaisManager
 
+# Interface fixa: evita sondagens hasattr() espalhadas pelo startup
+assert hasattr(FiliaisManager, 'listar_todas') and hasattr(FiliaisManager, 'obter_opcoes_combo'), \
+    "FiliaisManager não expõe a interface esperada (listar_todas/obter_opcoes_combo)"
+
 # Importações do módulo GUI refatorado
 from .constants import UIConstants
 from .validators import FormValidator, somente_digitos
@@ -61,6 +72,12 @@ ctk.set_appearance_mode(UIConstants.THEME_MODE)
 ctk.set_default_color_theme(UIConstants.THEME_COLOR)
 
 
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """Reutiliza fontes nomeadas: cada CTkFont registra uma fonte no Tk."""
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
 class App(ctk.CTk):
     """Aplicação principal da interface gráfica."""
     
@@ -94,8 +111,17 @@ class App(ctk.CTk):
         
         # Gerenciadores
         self._is_busy = False
-        self._thread_processamento = None
+        # Executor único para o trabalho pesado (conversão/aprendizado): evita
+        # criar uma thread nova por operação e dá um handle cancelável
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="siproquim-worker")
+        self._conversao_future = None
         self._filiais_manager = FiliaisManager()
+        # O combo nasce apenas com o placeholder; o carregamento das filiais e
+        # a montagem dos indices CNPJ->nome / CNPJ->opcao rodam em background
+        # para o primeiro paint da janela nao esperar I/O do cadastro
+        self._combo_options_cache = [UIConstants.PLACEHOLDER_COMBO_FILIAL]
+        self._cnpj_index = {}
+        self._cnpj_para_opcao_combo = {}
         self._progress_manager = ProgressManager()
         self._log_manager = None  # Será inicializado após criar a UI
         self._ajustes_por_nf = {}
@@ -109,6 +135,25 @@ class App(ctk.CTk):
         self._logs_prev_geom = None
         self._logs_animando = False
         self._thread_aprendizado = None
+        self._cnpj_after_id = None
+        self._campo_after_id = None
+        # Último diretório usado no diálogo de PDF: evita que o Windows
+        # reabra o diálogo na pasta padrão do shell (lenta de enumerar)
+        self._last_pdf_dir = str(downloads_dir())
+        # Throttle das atualizações de progresso de extração (ver _run_conversion)
+        self._last_progress_emit = 0.0
+        self._last_emit_frac = -1.0
+        # Gate do lado da UI: limita redesenhos de progresso a ~7 Hz mesmo
+        # quando o coalescer entrega várias atualizações num só drain
+        self._last_ui_ns = 0
+        self._log_queue = queue.Queue()
+        # Fila de atualizações de UI vindas do worker: coalescida em um único
+        # after() periódico em vez de um after(0) por evento (ver _post)
+        self._ui_queue = deque()
+        self._ui_pump_scheduled = False
+        # Validade por campo: cada trace revalida só o campo que mudou
+        self._valid = {'pdf': False, 'cnpj': False, 'mes': False, 'ano': False}
+        self._btn_enabled = None
         self._ui_images = {}
         self._log_event_count = 0
         self._log_pending_count = 0
@@ -120,63 +165,180 @@ class App(ctk.CTk):
         
         setup_ui(self)
         
-        # Inicializa gerenciador de logs após criar os widgets
-        # Passa frame_logs_col para mostrar/ocultar toda a coluna de logs se necessário
-        self._log_manager = LogManager(
-            self.textbox_logs,
-            self.frame_logs_col,
-            UIConstants.FONT_FAMILY_LOGS,
-            UIConstants.LOG_FONT_SIZE_DEFAULT,
-            on_log_added=self._registrar_resumo_log
-        )
+        # O textbox de logs e o LogManager são construídos sob demanda em
+        # _ensure_logs_built; até lá as mensagens acumulam em _pending_logs
+        self._log_manager = None
+        self._pending_logs = []
         
-        # Log inicial de inicialização
+        # Log inicial de inicialização (lote único: um ciclo normal/insert/disable)
         try:
-            self._log_manager.adicionar_banner("SISTEMA INICIALIZADO", "INFO")
-            self._log_manager.adicionar_sucesso("Sistema inicializado com sucesso!")
-            self._log_manager.adicionar_info(f"Versão: SIPROQUIM Converter V5 by valentelucass")
-            
-            # Verifica filiais
-            if hasattr(self._filiais_manager, 'listar_todas'):
-                total_filiais = len(self._filiais_manager.listar_todas())
-                self._log_manager.adicionar_info(f"Total de filiais cadastradas: {total_filiais}")
-            else:
-                # Se não tiver o método, conta pelo dicionário interno ou pelo método obter_opcoes_combo
-                if hasattr(self._filiais_manager, 'obter_opcoes_combo'):
-                    total_filiais = len(self._filiais_manager.obter_opcoes_combo())
-                elif hasattr(self._filiais_manager, 'filiais'):
-                    total_filiais = len(self._filiais_manager.filiais)
-                else:
-                    total_filiais = 0
-                self._log_manager.adicionar_info(f"Total de filiais cadastradas: {total_filiais}")
-                if not hasattr(self._filiais_manager, 'listar_todas'):
-                    self._log_manager.adicionar_aviso("FiliaisManager não possui método listar_todas - usando contagem alternativa")
-            
-            # Verifica se combo foi populado corretamente
-            opcoes_combo = self.combo_filial.cget("values")
-            if opcoes_combo and len(opcoes_combo) > 1:  # Mais de 1 porque tem o placeholder
-                self._log_manager.adicionar_sucesso(f"Combo de filiais carregado: {len(opcoes_combo) - 1} filiais disponíveis")
-            else:
-                self._log_manager.adicionar_aviso("Atenção: Combo de filiais não foi populado corretamente!")
-                self._log_manager.adicionar_debug(f"Opções no combo: {opcoes_combo}")
-            
-            self._log_manager.adicionar_info("Aguardando ação do usuário...")
+            linha_banner = "=" * 60
+            startup_logs = [
+                (linha_banner, "INFO"),
+                ("SISTEMA INICIALIZADO", "INFO"),
+                (linha_banner, "INFO"),
+                ("Sistema inicializado com sucesso!", "SUCESSO"),
+                ("Versão: SIPROQUIM Converter V5 by valentelucass", "INFO"),
+            ]
+
+            # Verifica filiais (interface do FiliaisManager é garantida no import)
+            total_filiais = len(self._filiais_manager.listar_todas())
+            startup_logs.append((f"Total de filiais cadastradas: {total_filiais}", "INFO"))
+
+            # O status do combo é logado por _aplicar_filiais_carregadas,
+            # quando o carregamento em background termina
+            startup_logs.append(("Aguardando ação do usuário...", "INFO"))
             resumo_memoria = self._aprendizado_store.resumo_memoria()
-            self._log_manager.adicionar_info(
-                f"Memoria ativa: {resumo_memoria.get('arquivo_db', '')}"
-            )
-            self._log_manager.adicionar_info(
+            startup_logs.append((
+                f"Memoria ativa: {resumo_memoria.get('arquivo_db', '')}",
+                "INFO",
+            ))
+            startup_logs.append((
                 "Memoria carregada: "
                 f"{resumo_memoria.get('total_pares', 0)} par(es) aprendidos "
                 f"(ativos={resumo_memoria.get('pares_ativos', 0)}, "
-                f"quarentena={resumo_memoria.get('pares_quarentena', 0)})."
-            )
+                f"quarentena={resumo_memoria.get('pares_quarentena', 0)}).",
+                "INFO",
+            ))
+            self._pending_logs.extend(startup_logs)
         except Exception as e:
-            # Se houver erro na inicialização dos logs, tenta adicionar de forma segura
+            # Se houver erro na inicialização dos logs, registra de forma segura
             try:
-                self._log_manager.adicionar_erro(f"Erro na inicialização: {str(e)}")
-            except:
-                pass  # Se nem isso funcionar, ignora
+                self._pending_logs.extend(startup_logs)  # Preserva o que já foi coletado
+            except Exception:
+                pass
+            self._pending_logs.append((f"Erro na inicialização: {str(e)}", "ERRO"))
+
+        # Carrega as filiais fora da thread principal e repopula o combo via after()
+        threading.Thread(target=self._load_filiais_async, daemon=True).start()
+
+        # Poller único que escoa em lote os logs vindos das threads de trabalho
+        self.after(UIConstants.LOG_QUEUE_POLL_MS, self._drain_log_queue)
+
+        # Cancela trabalho pendente do executor ao fechar a janela
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self) -> None:
+        """Encerra o executor e fecha a janela."""
+        try:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+        self.destroy()
+
+    def _log_async(self, mensagem: str, tipo: str = "INFO") -> None:
+        """Enfileira um log vindo de thread de trabalho.
+
+        Um after(0) por linha inundaria a fila de eventos do Tk em PDFs
+        grandes; a fila é consumida em lote pelo poller _drain_log_queue.
+        """
+        self._log_queue.put((mensagem, tipo))
+
+    def _flush_log_queue(self) -> None:
+        """Escoa imediatamente os logs pendentes (thread principal)."""
+        entradas = []
+        while len(entradas) < UIConstants.LOG_QUEUE_BATCH_MAX:
+            try:
+                entradas.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if entradas and self._log_manager:
+            self._log_manager.adicionar_bloco(entradas)
+
+    def _drain_log_queue(self) -> None:
+        """Poller periódico que consome a fila de logs em lote."""
+        self._flush_log_queue()
+        self.after(UIConstants.LOG_QUEUE_POLL_MS, self._drain_log_queue)
+
+    def _post(self, fn, *args) -> None:
+        """Enfileira uma atualização de UI vinda de thread de trabalho.
+
+        Todas as atualizações pendentes são aplicadas em um único ciclo do
+        event loop (_drain_ui_queue), em vez de um after(0) por evento — que
+        em PDFs grandes enfileiraria milhares de callbacks no Tk.
+        """
+        self._ui_queue.append((fn, args))
+        if not self._ui_pump_scheduled:
+            self._ui_pump_scheduled = True
+            self.after(UIConstants.UI_PUMP_MS, self._drain_ui_queue)
+
+    def _drain_ui_queue(self) -> None:
+        """Aplica todas as atualizações de UI pendentes de uma vez."""
+        self._ui_pump_scheduled = False
+        while True:
+            try:
+                fn, args = self._ui_queue.popleft()
+            except IndexError:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                pass
+
+    def _ensure_logs_built(self) -> None:
+        """Constrói o textbox de logs e o LogManager na primeira necessidade.
+
+        O CTkTextbox é um Tk Text estilizado, caro de criar; mantê-lo fora do
+        startup encurta o primeiro paint. Mensagens acumuladas em
+        _pending_logs são despejadas assim que o widget existe.
+        """
+        if self._log_manager:
+            return
+        self.textbox_logs = ctk.CTkTextbox(
+            self.frame_logs,
+            font=_font(UIConstants.LOG_FONT_SIZE_DEFAULT, family=UIConstants.FONT_FAMILY_LOGS),
+            text_color=UIConstants.COLOR_TEXT_PRIMARY,
+            fg_color=UIConstants.COLOR_BG_TEXTBOX,
+            border_width=0,
+            corner_radius=16,
+            wrap="word",
+        )
+        self.textbox_logs.grid(row=0, column=0, sticky="nsew", padx=12, pady=12)
+        # O LogManager mantém o textbox em state=normal com edição bloqueada
+        self._log_manager = LogManager(
+            self.textbox_logs,
+            self.frame_logs_col,
+            UIConstants.FONT_FAMILY_LOGS,
+            UIConstants.LOG_FONT_SIZE_DEFAULT,
+            on_log_added=self._registrar_resumo_log
+        )
+        if self._pending_logs:
+            self._log_manager.adicionar_bloco(self._pending_logs)
+            self._pending_logs = []
+
+    def _load_filiais_async(self) -> None:
+        """Carrega opções de filiais e índices de CNPJ em background."""
+        try:
+            opcoes_filiais = self._filiais_manager.obter_opcoes_combo()
+            cnpj_index = {}
+            cnpj_para_opcao = {}
+            for cnpj_filial, nome_filial in self._filiais_manager.listar_todas():
+                cnpj_limpo = somente_digitos(cnpj_filial)
+                cnpj_index[cnpj_limpo] = nome_filial
+                cnpj_para_opcao[cnpj_limpo] = f"{nome_filial} - {cnpj_filial}"
+        except Exception:
+            opcoes_filiais = []
+            cnpj_index = {}
+            cnpj_para_opcao = {}
+        self.after(0, self._aplicar_filiais_carregadas, opcoes_filiais, cnpj_index, cnpj_para_opcao)
+
+    def _aplicar_filiais_carregadas(self, opcoes_filiais, cnpj_index, cnpj_para_opcao) -> None:
+        """Aplica na UI (thread principal) as filiais carregadas em background."""
+        self._combo_options_cache = [UIConstants.PLACEHOLDER_COMBO_FILIAL] + list(opcoes_filiais)
+        self._cnpj_index = cnpj_index
+        self._cnpj_para_opcao_combo = cnpj_para_opcao
+        try:
+            self.combo_filial.configure(values=self._combo_options_cache)
+        except Exception:
+            pass
+        if opcoes_filiais:
+            entrada = (f"Combo de filiais carregado: {len(opcoes_filiais)} filiais disponíveis", "SUCESSO")
+        else:
+            entrada = ("Atenção: Combo de filiais não foi populado corretamente!", "AVISO")
+        if self._log_manager:
+            self._log_manager.adicionar_bloco([entrada])
+        else:
+            self._pending_logs.append(entrada)
 
     def _maximizar_janela_inicial(self) -> None:
         """Tenta iniciar a janela maximizada (Windows/Linux)."""
@@ -231,7 +393,10 @@ class App(ctk.CTk):
             padx=UIConstants.PADDING_MAIN, 
             pady=UIConstants.PADDING_MAIN
         )
-        self.main_frame.grid_columnconfigure(0, weight=1)
+        # Configura as duas colunas de uma vez (formulário | logs) para evitar
+        # chamadas repetidas ao Tk durante a construção da janela
+        for col, minsize in ((0, 500), (1, 400)):
+            self.main_frame.grid_columnconfigure(col, weight=1, minsize=minsize)
         self.main_frame.grid_rowconfigure(2, weight=1)  # Linha 2 (conteúdo) expande
 
         # ============================================================================
@@ -240,11 +405,7 @@ class App(ctk.CTk):
         self.lbl_titulo = ctk.CTkLabel(
             self.main_frame,
             text=UIConstants.TEXT_TITLE,
-            font=ctk.CTkFont(
-                family=UIConstants.FONT_FAMILY_TITLE,
-                size=UIConstants.FONT_SIZE_TITLE,
-                weight="bold"
-            ),
+            font=_font(UIConstants.FONT_SIZE_TITLE, "bold", family=UIConstants.FONT_FAMILY_TITLE),
             text_color=UIConstants.COLOR_TEXT_PRIMARY
         )
         self.lbl_titulo.grid(row=0, column=0, columnspan=2, pady=(15, 5), sticky="n")
@@ -252,10 +413,7 @@ class App(ctk.CTk):
         self.lbl_subtitulo = ctk.CTkLabel(
             self.main_frame,
             text=UIConstants.TEXT_SUBTITLE,
-            font=ctk.CTkFont(
-                family=UIConstants.FONT_FAMILY_TITLE,
-                size=UIConstants.FONT_SIZE_SUBTITLE
-            ),
+            font=_font(UIConstants.FONT_SIZE_SUBTITLE, family=UIConstants.FONT_FAMILY_TITLE),
             text_color=UIConstants.COLOR_TEXT_SECONDARY
         )
         self.lbl_subtitulo.grid(row=1, column=0, columnspan=2, pady=(0, 15), sticky="n")
@@ -272,7 +430,6 @@ class App(ctk.CTk):
             pady=(0, 0)
         )
         self.frame_formulario.columnconfigure(0, weight=1)
-        self.main_frame.grid_columnconfigure(0, weight=1, minsize=500)  # Coluna 1: formulário
         
         # --- Passo 1: Arquivo PDF ---
         self.frame_pdf = ctk.CTkFrame(self.frame_formulario, fg_color="transparent")
@@ -285,7 +442,7 @@ class App(ctk.CTk):
         self.lbl_step1 = ctk.CTkLabel(
             self.frame_pdf,
             text=UIConstants.TEXT_STEP_1,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_HEADING, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_HEADING, "bold"),
             anchor="w"
         )
         self.lbl_step1.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
@@ -322,7 +479,7 @@ class App(ctk.CTk):
         self.lbl_step2 = ctk.CTkLabel(
             self.frame_cnpj,
             text=UIConstants.TEXT_STEP_2,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_HEADING, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_HEADING, "bold"),
             anchor="w"
         )
         self.lbl_step2.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
@@ -353,28 +510,9 @@ class App(ctk.CTk):
         )
         self.btn_buscar_filial.grid(row=0, column=1)
 
-        # ComboBox de seleção de filial
-        try:
-            # Garante que o FiliaisManager está funcionando
-            if not hasattr(self._filiais_manager, 'obter_opcoes_combo'):
-                raise AttributeError("FiliaisManager não possui método obter_opcoes_combo")
-            
-            opcoes_filiais = self._filiais_manager.obter_opcoes_combo()
-            # Adiciona opção vazia no início para placeholder
-            if opcoes_filiais and len(opcoes_filiais) > 0:
-                opcoes_combo = [UIConstants.PLACEHOLDER_COMBO_FILIAL] + opcoes_filiais
-                print(f"[DEBUG] Combo populado com {len(opcoes_filiais)} filiais")
-            else:
-                opcoes_combo = [UIConstants.PLACEHOLDER_COMBO_FILIAL]
-                print("[DEBUG] Nenhuma filial encontrada, usando apenas placeholder")
-        except Exception as e:
-            # Em caso de erro, cria combo vazio com placeholder
-            opcoes_combo = [UIConstants.PLACEHOLDER_COMBO_FILIAL]
-            # Não pode usar _log_manager aqui pois ainda não foi inicializado
-            print(f"[ERRO] Erro ao carregar filiais no combo: {e}")
-            import traceback
-            traceback.print_exc()
-        
+        # ComboBox de seleção de filial (opções pré-computadas no __init__)
+        opcoes_combo = self._combo_options_cache
+
         self.combo_filial = ctk.CTkComboBox(
             self.frame_cnpj,
             values=opcoes_combo,
@@ -382,7 +520,7 @@ class App(ctk.CTk):
             height=UIConstants.HEIGHT_ENTRY,
             command=self._on_filial_selecionada,
             state="readonly",
-            dropdown_font=ctk.CTkFont(size=UIConstants.FONT_SIZE_NORMAL)
+            dropdown_font=_font(UIConstants.FONT_SIZE_NORMAL)
         )
         # Define valor inicial como placeholder
         if opcoes_combo:
@@ -393,7 +531,7 @@ class App(ctk.CTk):
         self.lbl_filial_info = ctk.CTkLabel(
             self.frame_cnpj,
             textvariable=self.nome_filial,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_NORMAL, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_NORMAL, "bold"),
             text_color=UIConstants.COLOR_TEXT_SUCCESS,
             anchor="w"
         )
@@ -403,7 +541,7 @@ class App(ctk.CTk):
         self.lbl_dica = ctk.CTkLabel(
             self.frame_cnpj,
             text=UIConstants.TEXT_DICA_CNPJ,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_SMALL),
+            font=_font(UIConstants.FONT_SIZE_SMALL),
             text_color=UIConstants.COLOR_TEXT_HINT,
             anchor="w"
         )
@@ -421,7 +559,7 @@ class App(ctk.CTk):
         self.lbl_step3 = ctk.CTkLabel(
             self.frame_mes_ano,
             text=UIConstants.TEXT_STEP_3,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_HEADING, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_HEADING, "bold"),
             anchor="w"
         )
         self.lbl_step3.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
@@ -451,7 +589,7 @@ class App(ctk.CTk):
         self.lbl_dica_mes_ano = ctk.CTkLabel(
             self.frame_mes_ano,
             text=UIConstants.TEXT_DICA_MES_ANO,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_SMALL),
+            font=_font(UIConstants.FONT_SIZE_SMALL),
             text_color=UIConstants.COLOR_TEXT_HINT,
             anchor="w"
         )
@@ -469,7 +607,7 @@ class App(ctk.CTk):
         self.lbl_step4 = ctk.CTkLabel(
             self.frame_aprendizado,
             text=UIConstants.TEXT_STEP_4,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_HEADING, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_HEADING, "bold"),
             anchor="w"
         )
         self.lbl_step4.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 8))
@@ -506,7 +644,7 @@ class App(ctk.CTk):
         self.lbl_dica_aprendizado = ctk.CTkLabel(
             self.frame_aprendizado,
             text=UIConstants.TEXT_DICA_APRENDIZADO,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_SMALL),
+            font=_font(UIConstants.FONT_SIZE_SMALL),
             text_color=UIConstants.COLOR_TEXT_HINT,
             anchor="w",
             justify="left"
@@ -536,7 +674,7 @@ class App(ctk.CTk):
         self.lbl_memoria_path = ctk.CTkLabel(
             self.frame_memoria_info,
             text=self._formatar_texto_memoria(caminho_memoria),
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_TINY),
+            font=_font(UIConstants.FONT_SIZE_TINY),
             text_color=UIConstants.COLOR_TEXT_HINT,
             anchor="w",
             justify="left",
@@ -558,7 +696,6 @@ class App(ctk.CTk):
         )
         self.frame_logs_col.columnconfigure(0, weight=1)
         self.frame_logs_col.rowconfigure(2, weight=1)
-        self.main_frame.grid_columnconfigure(1, weight=1, minsize=400)  # Coluna 2: logs
         
         # Cabeçalho dos Logs (título + controles de fonte)
         self.frame_logs_header = ctk.CTkFrame(self.frame_logs_col, fg_color="transparent")
@@ -569,7 +706,7 @@ class App(ctk.CTk):
         self.lbl_logs_title = ctk.CTkLabel(
             self.frame_logs_header,
             text=UIConstants.TEXT_LOGS_TITLE,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_HEADING, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_HEADING, "bold"),
             anchor="w"
         )
         self.lbl_logs_title.grid(row=0, column=0, sticky="w")
@@ -625,7 +762,7 @@ class App(ctk.CTk):
         self.lbl_logs_legend = ctk.CTkLabel(
             self.frame_logs_col,
             text=UIConstants.TEXT_LOGS_LEGEND,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_TINY),
+            font=_font(UIConstants.FONT_SIZE_TINY),
             text_color=UIConstants.COLOR_TEXT_HINT,
             anchor="w"
         )
@@ -644,7 +781,7 @@ class App(ctk.CTk):
         # Textbox para logs (scrollable)
         self.textbox_logs = ctk.CTkTextbox(
             self.frame_logs,
-            font=ctk.CTkFont(family=UIConstants.FONT_FAMILY_LOGS, size=UIConstants.LOG_FONT_SIZE_DEFAULT),
+            font=_font(UIConstants.LOG_FONT_SIZE_DEFAULT, family=UIConstants.FONT_FAMILY_LOGS),
             text_color=UIConstants.COLOR_LOG_ERROR,
             fg_color=UIConstants.COLOR_BG_TEXTBOX
         )
@@ -666,7 +803,7 @@ class App(ctk.CTk):
         self.lbl_status = ctk.CTkLabel(
             self.frame_status,
             textvariable=self.status,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_NORMAL)
+            font=_font(UIConstants.FONT_SIZE_NORMAL)
         )
         self.lbl_status.grid(row=0, column=0, pady=(12, 8), padx=15)
 
@@ -681,7 +818,7 @@ class App(ctk.CTk):
         self.lbl_tempo = ctk.CTkLabel(
             self.frame_status,
             text="",
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_TINY),
+            font=_font(UIConstants.FONT_SIZE_TINY),
             text_color=UIConstants.COLOR_TEXT_SECONDARY
         )
         self.lbl_tempo.grid(row=2, column=0, pady=(0, 12), padx=15)
@@ -694,7 +831,7 @@ class App(ctk.CTk):
             text=UIConstants.TEXT_BUTTON_CONVERTER,
             command=self._on_gerar,
             height=UIConstants.HEIGHT_BUTTON_LARGE,
-            font=ctk.CTkFont(size=UIConstants.FONT_SIZE_BUTTON, weight="bold"),
+            font=_font(UIConstants.FONT_SIZE_BUTTON, "bold"),
             fg_color=UIConstants.COLOR_PRIMARY,
             hover_color=UIConstants.COLOR_PRIMARY_HOVER,
             state="disabled"
@@ -711,21 +848,47 @@ class App(ctk.CTk):
         self.mes_selecionado.trace_add("write", self._on_campo_changed)
 
     def _verificar_habilitar_botao(self) -> None:
-        """Verifica se o formulário está válido e habilita/desabilita o botão."""
+        """Revalida todos os campos e habilita/desabilita o botão."""
+        self._revalidate_pdf(aplicar=False)
+        self._revalidate_cnpj(aplicar=False)
+        self._revalidate_mes(aplicar=False)
+        self._revalidate_ano(aplicar=False)
+        self._apply_button_state()
+
+    def _revalidate_pdf(self, aplicar: bool = True) -> None:
+        """Revalida apenas o campo de PDF."""
         pdf = (self.pdf_path.get() or "").strip()
+        self._valid['pdf'] = FormValidator.validar_pdf(pdf)[0]
+        if aplicar:
+            self._apply_button_state()
+
+    def _revalidate_cnpj(self, aplicar: bool = True) -> None:
+        """Revalida apenas o campo de CNPJ."""
         cnpj = somente_digitos(self.cnpj_mapa.get())
-        mes = self.mes_selecionado.get()
+        self._valid['cnpj'] = FormValidator.validar_cnpj(cnpj)[0]
+        if aplicar:
+            self._apply_button_state()
+
+    def _revalidate_mes(self, aplicar: bool = True) -> None:
+        """Revalida apenas o campo de mês."""
+        self._valid['mes'] = FormValidator.validar_mes(self.mes_selecionado.get())[0]
+        if aplicar:
+            self._apply_button_state()
+
+    def _revalidate_ano(self, aplicar: bool = True) -> None:
+        """Revalida apenas o campo de ano."""
         ano_str = somente_digitos(self.ano_selecionado.get())
-        
-        # Validações usando FormValidator
-        pdf_valido, _ = FormValidator.validar_pdf(pdf)
-        cnpj_valido, _ = FormValidator.validar_cnpj(cnpj)
-        mes_valido, _, _ = FormValidator.validar_mes(mes)
-        ano_valido, _, _ = FormValidator.validar_ano(ano_str)
-        
-        valid = pdf_valido and cnpj_valido and mes_valido and ano_valido
-        
-        if valid:
+        self._valid['ano'] = FormValidator.validar_ano(ano_str)[0]
+        if aplicar:
+            self._apply_button_state()
+
+    def _apply_button_state(self) -> None:
+        """Aplica o estado agregado no botão, só tocando o Tk quando ele muda."""
+        habilitado = all(self._valid.values())
+        if habilitado == self._btn_enabled:
+            return
+        self._btn_enabled = habilitado
+        if habilitado:
             self.btn_converter.configure(
                 state="normal",
                 fg_color=UIConstants.COLOR_PRIMARY
@@ -737,8 +900,17 @@ class App(ctk.CTk):
             )
 
     def _on_campo_changed(self, *args) -> None:
-        """Callback quando mês ou ano são alterados."""
-        self._verificar_habilitar_botao()
+        """Callback quando mês ou ano são alterados (com debounce)."""
+        if self._campo_after_id:
+            self.after_cancel(self._campo_after_id)
+        self._campo_after_id = self.after(UIConstants.TRACE_DEBOUNCE_MS, self._apply_campo_change)
+
+    def _apply_campo_change(self) -> None:
+        """Aplica a validação após o debounce de mês/ano."""
+        self._campo_after_id = None
+        self._revalidate_mes(aplicar=False)
+        self._revalidate_ano(aplicar=False)
+        self._apply_button_state()
 
     def _buscar_filial_por_cnpj(self) -> None:
         """Busca filial pelo CNPJ digitado."""
@@ -758,17 +930,15 @@ class App(ctk.CTk):
             if self._log_manager:
                 self._log_manager.adicionar_info(f"Buscando filial com CNPJ: {cnpj}")
             
-            nome_filial = self._filiais_manager.buscar_por_cnpj(cnpj)
+            nome_filial = self._cnpj_index.get(cnpj)
             if nome_filial:
                 if self._log_manager:
                     self._log_manager.adicionar_sucesso(f"Filial encontrada: {nome_filial}")
                 self.nome_filial.set(UIConstants.TEXT_INFO_CNPJ_ENCONTRADO.format(nome=nome_filial, cnpj=cnpj))
-                # Seleciona no combo também se existir
-                opcoes = self.combo_filial.cget("values")
-                for opcao in opcoes:
-                    if cnpj in opcao:
-                        self.filial_selecionada.set(opcao)
-                        break
+                # Seleciona no combo também se existir (lookup O(1) pré-computado)
+                opcao = self._cnpj_para_opcao_combo.get(cnpj)
+                if opcao:
+                    self.filial_selecionada.set(opcao)
                 self._verificar_habilitar_botao()
             else:
                 if self._log_manager:
@@ -779,7 +949,8 @@ class App(ctk.CTk):
             erro_msg = f"Erro ao buscar filial: {str(e)}"
             if self._log_manager:
                 self._log_manager.adicionar_erro(erro_msg)
-                self._log_manager.adicionar_debug(f"Traceback: {traceback.format_exc()[:300]}")
+                if self._log_manager.is_debug_enabled():
+                    self._log_manager.adicionar_debug(f"Traceback: {traceback.format_exc()[:300]}")
             messagebox.showerror("Erro", erro_msg)
     
     def _on_filial_selecionada(self, choice: str) -> None:
@@ -787,10 +958,9 @@ class App(ctk.CTk):
         try:
             if choice and choice != UIConstants.PLACEHOLDER_COMBO_FILIAL:
                 # Extrai CNPJ da string formatada: "NOME - CNPJ"
-                partes = choice.split(" - ")
-                if len(partes) >= 2:
-                    cnpj = partes[-1]  # Última parte é o CNPJ
-                    nome = " - ".join(partes[:-1])  # Resto é o nome
+                # rpartition faz uma única varredura, sem lista intermediária
+                nome, sep, cnpj = choice.rpartition(" - ")
+                if sep:
                     if self._log_manager:
                         self._log_manager.adicionar_info(f"Filial selecionada: {nome} ({cnpj})")
                     self.cnpj_mapa.set(cnpj)
@@ -810,11 +980,24 @@ class App(ctk.CTk):
             erro_msg = f"Erro ao processar seleção de filial: {str(e)}"
             if self._log_manager:
                 self._log_manager.adicionar_erro(erro_msg)
-                self._log_manager.adicionar_debug(f"Traceback: {traceback.format_exc()[:300]}")
+                if self._log_manager.is_debug_enabled():
+                    self._log_manager.adicionar_debug(f"Traceback: {traceback.format_exc()[:300]}")
             messagebox.showerror("Erro", erro_msg)
 
     def _on_cnpj_changed(self, *args) -> None:
-        """Callback quando CNPJ é alterado no campo."""
+        """Callback quando CNPJ é alterado no campo (com debounce).
+
+        O trace dispara uma vez por caractere; ao colar um CNPJ inteiro isso
+        estoura em 14 validações completas. O debounce cancela o agendamento
+        pendente e valida apenas o estado final do burst.
+        """
+        if self._cnpj_after_id:
+            self.after_cancel(self._cnpj_after_id)
+        self._cnpj_after_id = self.after(UIConstants.TRACE_DEBOUNCE_MS, self._apply_cnpj_change)
+
+    def _apply_cnpj_change(self) -> None:
+        """Aplica truncamento, lookup de filial e validação após o debounce."""
+        self._cnpj_after_id = None
         cnpj = somente_digitos(self.cnpj_mapa.get())
         if len(cnpj) > CNPJ_TAMANHO:
             self.cnpj_mapa.set(cnpj[:CNPJ_TAMANHO])
@@ -822,27 +1005,34 @@ class App(ctk.CTk):
         
         # Se CNPJ tem CNPJ_TAMANHO dígitos, tenta buscar automaticamente
         if len(cnpj) == CNPJ_TAMANHO:
-            nome_filial = self._filiais_manager.buscar_por_cnpj(cnpj)
+            nome_filial = self._cnpj_index.get(cnpj)
             if nome_filial:
                 self.nome_filial.set(UIConstants.TEXT_INFO_CNPJ_ENCONTRADO.format(nome=nome_filial, cnpj=cnpj))
+                # Auto-seleciona a filial no combo pelo mesmo mapa reverso
+                opcao = self._cnpj_para_opcao_combo.get(cnpj)
+                if opcao and self.filial_selecionada.get() != opcao:
+                    self.filial_selecionada.set(opcao)
             else:
                 self.nome_filial.set(UIConstants.TEXT_AVISO_CNPJ_NAO_ENCONTRADO.format(cnpj=cnpj))
         
-        self._verificar_habilitar_botao()
+        self._revalidate_cnpj()
 
     def _choose_pdf(self) -> None:
         """Abre diálogo para seleção de arquivo PDF."""
         path = filedialog.askopenfilename(
             title=UIConstants.DIALOG_TITLE_PDF,
             filetypes=UIConstants.FILE_TYPES_PDF,
+            initialdir=self._last_pdf_dir,
         )
         if path:
+            self._last_pdf_dir = str(Path(path).parent)
             self.pdf_path.set(path)
             self.status.set(f"Arquivo selecionado: {Path(path).name}")
-            self._verificar_habilitar_botao()
+            self._revalidate_pdf()
 
     def _on_aprender_txt(self) -> None:
         """Seleciona TXT corrigido e inicia aprendizado em thread."""
+        self._ensure_logs_built()
         if not self._aprendizado_store:
             if self._log_manager:
                 self._log_manager.adicionar_erro("Memoria de aprendizado indisponivel no momento.")
@@ -867,12 +1057,7 @@ class App(ctk.CTk):
             self._log_manager.adicionar_banner("APRENDIZADO", "STATUS")
             self._log_manager.adicionar_info(f"Arquivo selecionado para aprendizado: {Path(caminho_txt).name}")
 
-        self._thread_aprendizado = threading.Thread(
-            target=self._run_aprendizado_txt,
-            args=(caminho_txt,),
-            daemon=True,
-        )
-        self._thread_aprendizado.start()
+        self._thread_aprendizado = self._executor.submit(self._run_aprendizado_txt, caminho_txt)
 
     def _run_aprendizado_txt(self, caminho_txt: str) -> None:
         """Executa aprendizado de TXT em background."""
@@ -880,7 +1065,7 @@ class App(ctk.CTk):
             if not self._aprendizado_store:
                 raise RuntimeError("Memoria de aprendizado indisponivel.")
             resultado = self._aprendizado_store.aprender_com_txt(caminho_txt)
-            self.after(0, lambda: self._log_resumo_aprendizado(resultado))
+            self._post(self._log_resumo_aprendizado, resultado)
             replay = bool(resultado.get("replay_detectado", False))
             self.after(
                 0,
@@ -920,11 +1105,11 @@ class App(ctk.CTk):
             )
         except Exception as exc:
             erro = f"Falha ao aprender com TXT: {exc}"
-            self.after(0, lambda: self._log_manager.adicionar_erro(erro) if self._log_manager else None)
-            self.after(0, lambda: self.status.set("Falha no aprendizado."))
-            self.after(0, lambda: messagebox.showerror(UIConstants.DIALOG_TITLE_ERRO, erro))
+            self._post(lambda: self._log_manager.adicionar_erro(erro) if self._log_manager else None)
+            self._post(self.status.set, "Falha no aprendizado.")
+            self._post(messagebox.showerror, UIConstants.DIALOG_TITLE_ERRO, erro)
         finally:
-            self.after(0, lambda: self._set_aprendizado_busy(False))
+            self._post(self._set_aprendizado_busy, False)
 
     @staticmethod
     def _formatar_texto_memoria(caminho: str) -> str:
@@ -1025,10 +1210,12 @@ class App(ctk.CTk):
             self.btn_abrir_memoria.configure(state="normal" if self._aprendizado_store else "disabled")
             self.btn_buscar.configure(state="normal")
             self.entry_cnpj.configure(state="normal")
+            self._btn_enabled = None  # Força reaplicar o estado do botão
             self._verificar_habilitar_botao()
 
     def _on_gerar(self) -> None:
         """Inicia o processamento de conversão do PDF."""
+        self._ensure_logs_built()
         try:
             # Limpa logs anteriores
             if self._log_manager:
@@ -1057,10 +1244,11 @@ class App(ctk.CTk):
                 messagebox.showerror("Erro", erro_msg or UIConstants.TEXT_ERRO_PDF_INVALIDO)
                 return
             
+            nome_pdf = Path(dados['pdf']).name
             if self._log_manager:
                 self._log_manager.adicionar("Formulario validado com sucesso! [OK]", "STATUS")
                 self._log_manager.adicionar(
-                    f"ARQUIVO: {Path(dados['pdf']).name}",
+                    f"ARQUIVO: {nome_pdf}",
                     "CONFIG"
                 )
                 self._log_manager.adicionar(
@@ -1071,13 +1259,13 @@ class App(ctk.CTk):
             erro_msg = f"Erro ao validar formulário: {str(e)}"
             if self._log_manager:
                 self._log_manager.adicionar_erro(erro_msg)
-                self._log_manager.adicionar_debug(f"Traceback: {traceback.format_exc()[:300]}")
+                if self._log_manager.is_debug_enabled():
+                    self._log_manager.adicionar_debug(f"Traceback: {traceback.format_exc()[:300]}")
             messagebox.showerror("Erro", erro_msg)
             return
 
         # Prepara caminhos com nomenclatura: M + ANO + MÊS + CNPJ + NOME_PDF
         saida_dir = downloads_dir()
-        nome_pdf = Path(dados['pdf']).name
         nome_saida = gerar_nome_arquivo_saida(
             dados['ano_numero'],
             dados['mes_abreviado'],
@@ -1089,13 +1277,12 @@ class App(ctk.CTk):
         # UI Busy State
         self._set_busy(True)
         
-        # Thread de processamento
-        self._thread_processamento = threading.Thread(
-            target=self._run_conversion,
-            args=(dados['pdf'], dados['cnpj'], str(saida_path), dados['mes_numero'], dados['ano_numero']),
-            daemon=True
+        # Despacha o processamento para o executor compartilhado
+        self._conversao_future = self._executor.submit(
+            self._run_conversion,
+            dados['pdf'], dados['cnpj'], str(saida_path),
+            dados['mes_numero'], dados['ano_numero'],
         )
-        self._thread_processamento.start()
 
     def _adicionar_log_erro(self, mensagem: str, tipo: str = "ERRO"):
         """Adiciona uma mensagem ao log (deprecated - usar _log_manager)."""
@@ -1109,13 +1296,12 @@ class App(ctk.CTk):
     
     def _ajustar_fonte_logs(self, delta: int) -> None:
         """Ajusta o tamanho da fonte do log para melhor visualização."""
-        if self._log_manager:
-            self._log_manager.ajustar_fonte(delta)
+        self._ensure_logs_built()
+        self._log_manager.ajustar_fonte(delta)
 
     def _exportar_logs(self) -> None:
         """Exporta os logs para um arquivo .txt."""
-        if not self._log_manager:
-            return
+        self._ensure_logs_built()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nome_padrao = f"logs_siproquim_{timestamp}.txt"
         caminho = filedialog.asksaveasfilename(
@@ -1130,6 +1316,7 @@ class App(ctk.CTk):
 
     def _toggle_logs_fullscreen(self) -> None:
         """Alterna o modo de tela cheia dos logs."""
+        self._ensure_logs_built()
         if self._logs_fullscreen:
             self._sair_logs_fullscreen()
         else:
@@ -1166,7 +1353,8 @@ class App(ctk.CTk):
                 self.main_frame._parent_canvas.yview_moveto(0)
             except Exception:
                 pass
-        self.textbox_logs.focus_set()
+        if self.textbox_logs:
+            self.textbox_logs.focus_set()
 
     def _sair_logs_fullscreen(self) -> None:
         """Restaura os logs para o fluxo vertical da pagina."""
@@ -1406,6 +1594,7 @@ class App(ctk.CTk):
         """Exibe um resumo final para a analista."""
         if not self._log_manager:
             return
+        self._flush_log_queue()  # Garante a ordem: logs pendentes antes do resumo
         total_nfs = len(self._ajustes_por_nf)
 
         if total_nfs == 0 and not self._alertas_operacionais:
@@ -1474,6 +1663,7 @@ class App(ctk.CTk):
         """Exibe o relatorio final com os principais indicadores."""
         if not self._log_manager:
             return
+        self._flush_log_queue()
 
         stats = self._ultima_estatistica or {}
         total_aprovados = stats.get('total_aprovados')
@@ -1513,54 +1703,66 @@ class App(ctk.CTk):
     def _run_conversion(self, pdf, cnpj, saida_path, mes, ano):
         """Executa a conversao do PDF em thread separada."""
         try:
-            self.after(0, lambda: self._log_manager.adicionar("Iniciando processamento...", "SYSTEM"))
+            self._log_async("Iniciando processamento...", "SYSTEM")
+            # Zera o throttle de progresso para esta conversão
+            self._last_progress_emit = 0.0
+            self._last_emit_frac = -1.0
 
             # Callback de progresso para atualizar UI
             def callback_progresso(etapa, detalhes):
                 try:
                     if etapa == 'abrir':
                         arquivo = detalhes.get('arquivo', '')
-                        self.after(0, lambda: self._atualizar_status('Abrindo PDF...', arquivo))
-                        self.after(0, lambda: self._log_manager.adicionar(f"Abrindo PDF: {arquivo}", "STATUS"))
+                        self._post(self._atualizar_status, 'Abrindo PDF...', arquivo)
+                        self._log_async(f"Abrindo PDF: {arquivo}", "STATUS")
                     elif etapa == 'extrair':
                         pagina_atual = detalhes.get('pagina_atual', 0)
                         total_paginas = detalhes.get('total_paginas', 0)
                         self._progress_manager.total_paginas = total_paginas
                         self._progress_manager.pagina_atual = pagina_atual
                         progresso = self._progress_manager.calcular_progresso_extracao(pagina_atual, total_paginas)
-                        self.after(0, lambda: self._atualizar_progresso_extracao(pagina_atual, total_paginas, progresso))
+                        # Throttle: só atualiza a UI quando o progresso avançou
+                        # >=1% ou passaram 200ms, limitando o fluxo de after()
+                        # em PDFs grandes. A última página sempre é emitida.
+                        agora = time.monotonic()
+                        frac = pagina_atual / total_paginas if total_paginas else 0.0
+                        if (pagina_atual >= total_paginas
+                                or frac - self._last_emit_frac >= 0.01
+                                or agora - self._last_progress_emit >= 0.2):
+                            self._last_progress_emit = agora
+                            self._last_emit_frac = frac
+                            self._post(self._atualizar_progresso_extracao, pagina_atual, total_paginas, progresso)
 
                         if self._progress_manager.deve_logar_pagina(pagina_atual, total_paginas):
                             barra = self._formatar_barra_progresso(progresso)
                             percentual = int(progresso * 100)
                             msg = f"Extraindo dados: {barra} {percentual}% (Pag {pagina_atual}/{total_paginas})"
-                            self.after(0, lambda m=msg: self._log_manager.adicionar(m, "PROGRESSO"))
+                            self._log_async(msg, "PROGRESSO")
                     elif etapa == 'deduplicar':
                         total = detalhes.get('total_registros', 0)
                         total_nfs = detalhes.get('total_nfs', 0)
                         self._total_registros_extraidos = total
                         self._total_nfs_dedup = total_nfs
-                        self.after(0, lambda: self._atualizar_status('Deduplicando registros...', f'{total} registros encontrados'))
-                        self.after(0, update_metric_cards, self)
-                        self.after(
-                            0,
+                        self._post(self._atualizar_status, 'Deduplicando registros...', f'{total} registros encontrados')
+                        self._post(update_metric_cards, self)
+                        self._post(
                             update_progress_card,
                             self,
                             UIConstants.PROGRESSO_DEDUPLICAR,
                             f"{total_nfs} NFs apos deduplicacao",
                         )
-                        self.after(0, lambda: self._log_manager.adicionar(
+                        self._log_async(
                             f"Registros encontrados: {total} | Apos deduplicacao: {total_nfs}",
                             "INFO"
-                        ))
+                        )
                     elif etapa == 'processar':
                         if 'total_registros' in detalhes:
                             total = detalhes.get('total_registros', 0)
-                            self.after(0, lambda: self._log_manager.adicionar(f"Validando {total} registros...", "STATUS"))
-                            self.after(0, lambda: self._log_manager.adicionar(
+                            self._log_async(f"Validando {total} registros...", "STATUS")
+                            self._log_async(
                                 "Aplicando Validacao Robusta (CHECKSUM + INTEGRIDADE)",
                                 "INFO"
-                            ))
+                            )
                         else:
                             self._ultima_estatistica = {
                                 'total_aprovados': detalhes.get('total_aprovados'),
@@ -1570,35 +1772,34 @@ class App(ctk.CTk):
                                 'total_ajustes_manuais': detalhes.get('total_ajustes_manuais', 0),
                             }
                             ajustes = self._ultima_estatistica.get('total_ajustes_manuais', 0)
-                            self.after(0, update_metric_cards, self)
-                            self.after(0, lambda: self._log_manager.adicionar(
+                            self._post(update_metric_cards, self)
+                            self._log_async(
                                 f"Validacao concluida. Ajustes manuais: {ajustes}",
                                 "STATUS"
-                            ))
+                            )
                     elif etapa == 'gerar':
                         total_nfs = detalhes.get('total_nfs', 0)
-                        self.after(0, lambda: self._atualizar_status('Gerando arquivo TXT...', f'{total_nfs} NFs unicas'))
-                        self.after(
-                            0,
+                        self._post(self._atualizar_status, 'Gerando arquivo TXT...', f'{total_nfs} NFs unicas')
+                        self._post(
                             update_progress_card,
                             self,
                             UIConstants.PROGRESSO_GERAR,
                             f"Montando arquivo final com {total_nfs} NFs",
                         )
-                        self.after(0, lambda: self._log_manager.adicionar(
+                        self._log_async(
                             f"Gerando TXT com {total_nfs} NFs unicas...",
                             "STATUS"
-                        ))
+                        )
                     elif etapa == 'aviso':
                         mensagem = detalhes.get('mensagem', '')
                         tipo = detalhes.get('tipo', 'AVISO')
                         if mensagem:
                             if tipo in ('ERRO', 'CRITICO'):
-                                self.after(0, lambda: self._log_manager.adicionar_erro(mensagem))
+                                self._log_async(mensagem, "ERRO")
                             elif tipo in ('ATENCAO', 'ACAO', 'ACAO_NECESSARIA', 'ALERTA'):
                                 self._registrar_ajuste(None, tipo, mensagem)
                             else:
-                                self.after(0, lambda: self._log_manager.adicionar(mensagem, "INFO"))
+                                self._log_async(mensagem, "INFO")
                     elif etapa == 'ajuste_manual':
                         nf = detalhes.get('nf')
                         tipo = detalhes.get('tipo', 'AVISO')
@@ -1611,23 +1812,22 @@ class App(ctk.CTk):
                         if normalizado:
                             tipo_norm, msg_norm = normalizado
                             if tipo_norm == 'ERRO':
-                                self.after(0, lambda: self._log_manager.adicionar_erro(msg_norm))
+                                self._log_async(msg_norm, "ERRO")
                             elif tipo_norm == 'SUCESSO':
-                                self.after(0, lambda: self._log_manager.adicionar_sucesso(msg_norm))
+                                self._log_async(msg_norm, "SUCESSO")
                             elif tipo_norm in ('AVISO', 'ALERTA', 'ATENCAO', 'ACAO_NECESSARIA'):
-                                self.after(0, lambda: self._log_manager.adicionar_aviso(msg_norm))
+                                self._log_async(msg_norm, "AVISO")
                             else:
-                                self.after(0, lambda: self._log_manager.adicionar(msg_norm, tipo_norm))
+                                self._log_async(msg_norm, tipo_norm)
                     elif etapa == 'finalizar':
-                        self.after(
-                            0,
+                        self._post(
                             update_progress_card,
                             self,
                             UIConstants.PROGRESSO_COMPLETO,
                             "Arquivo TXT validado e pronto para envio.",
                         )
                 except Exception as e:
-                    self.after(0, lambda: self._log_manager.adicionar_erro(f"Erro no callback: {str(e)}"))
+                    self._log_async(f"Erro no callback: {str(e)}", "ERRO")
 
             # Processa o PDF
             caminho_final = processar_pdf(
@@ -1635,48 +1835,55 @@ class App(ctk.CTk):
                 callback_progresso=callback_progresso,
                 mes=mes, ano=ano
             )
-            self.after(0, self._log_resumo_analista)
-            self.after(0, self._log_relatorio_final)
+            self._post(self._log_resumo_analista)
+            self._post(self._log_relatorio_final)
             total_criticos = self._ultima_estatistica.get('total_com_erros_criticos', 0)
             if total_criticos > 0:
-                self.after(0, lambda: self._log_manager.adicionar(
-                    "Processamento concluido com pendencias criticas.", "AVISO"
-                ))
+                self._log_async("Processamento concluido com pendencias criticas.", "AVISO")
             else:
-                self.after(0, lambda: self._log_manager.adicionar("Processamento concluido com sucesso!", "SUCESSO"))
-            self.after(0, lambda: self._log_manager.adicionar(f"ARQUIVO GERADO: {caminho_final}", "EXPORT"))
-            self.after(0, lambda: self._log_manager.adicionar("=" * 60, "SYSTEM"))
-            self.after(0, lambda: self._on_sucesso(caminho_final, tem_criticos=(total_criticos > 0)))
+                self._log_async("Processamento concluido com sucesso!", "SUCESSO")
+            self._log_async(f"ARQUIVO GERADO: {caminho_final}", "EXPORT")
+            self._log_async("=" * 60, "SYSTEM")
+            self._post(lambda: self._on_sucesso(caminho_final, tem_criticos=(total_criticos > 0)))
 
         except FileNotFoundError as e:
             erro_msg = f"Arquivo nao encontrado: {str(e)}"
-            self.after(0, lambda: self._log_manager.adicionar_erro(erro_msg))
-            self.after(0, lambda: self._on_erro(erro_msg))
+            self._log_async(erro_msg, "ERRO")
+            self._post(self._on_erro, erro_msg)
         except ValueError as e:
             erro_msg = f"Erro de validacao: {str(e)}"
-            self.after(0, lambda: self._log_manager.adicionar_erro(erro_msg))
-            self.after(0, lambda: self._on_erro(erro_msg))
+            self._log_async(erro_msg, "ERRO")
+            self._post(self._on_erro, erro_msg)
         except Exception as e:
-            erro_completo = traceback.format_exc()
             erro_msg = f"Erro inesperado: {str(e)}"
-            self.after(0, lambda: self._log_manager.adicionar_erro(erro_msg))
-            self.after(0, lambda: self._log_manager.adicionar_erro("=" * 60))
-            self.after(0, lambda: self._log_manager.adicionar_debug(f"Detalhes do erro:"))
-            # Divide o traceback em linhas para melhor legibilidade
-            linhas_traceback = erro_completo.split('\n')
-            for linha in linhas_traceback[:15]:
-                if linha.strip():
-                    self.after(0, lambda l=linha: self._log_manager.adicionar_debug(f"  {l}"))
-            if len(linhas_traceback) > 15:
-                self.after(0, lambda: self._log_manager.adicionar_debug(
-                    f"  ... ({len(linhas_traceback) - 15} linhas omitidas)"
-                ))
-            self.after(0, lambda: self._log_manager.adicionar_erro("=" * 60))
-            self.after(0, lambda: self._log_manager.adicionar("Verifique os logs acima para mais detalhes.", "INFO"))
-            self.after(0, lambda: self._on_erro(erro_msg))
+            self._log_async(erro_msg, "ERRO")
+            self._log_async("=" * 60, "ERRO")
+            # Percorre o traceback como stream (sem materializar o texto
+            # completo) e entrega as 15 primeiras linhas em um evento só
+            linhas_traceback = (
+                linha.rstrip()
+                for trecho in traceback.TracebackException.from_exception(e).format()
+                for linha in trecho.splitlines()
+                if linha.strip()
+            )
+            bloco = '\n'.join(f"  {linha}" for linha in itertools.islice(linhas_traceback, 15))
+            omitidas = sum(1 for _ in linhas_traceback)
+            if omitidas:
+                bloco += f"\n  ... ({omitidas} linhas omitidas)"
+            if bloco:
+                self._log_async("Detalhes do erro:\n" + bloco, "DEBUG")
+            self._log_async("=" * 60, "ERRO")
+            self._log_async("Verifique os logs acima para mais detalhes.", "INFO")
+            self._post(self._on_erro, erro_msg)
 
     def _atualizar_progresso_extracao(self, pagina_atual, total_paginas, progresso):
         """Atualiza progresso durante extração de páginas."""
+        # No máximo um redesenho a cada 150ms; a última página sempre passa
+        agora_ns = time.monotonic_ns()
+        if agora_ns - self._last_ui_ns < 150_000_000 and pagina_atual < total_paginas:
+            return
+        self._last_ui_ns = agora_ns
+
         update_progress_card(self, progresso, f"Leitura do PDF: pagina {pagina_atual}/{total_paginas}")
         
         # Calcula tempo decorrido e estimado usando ProgressManager
@@ -1737,10 +1944,18 @@ class App(ctk.CTk):
         msg = f"{UIConstants.TEXT_SUCESSO_ARQUIVO_SALVO}\n{caminho_abs}\n\n{UIConstants.TEXT_SUCESSO_ABRIR_DOWNLOADS}"
         
         if messagebox.askyesno(UIConstants.DIALOG_TITLE_SUCESSO, msg):
+            # Abre o explorador sem bloquear o main loop do Tk (Popen retorna
+            # imediatamente, ao contrário de subprocess.run)
             try:
-                os.startfile(downloads_dir())
-            except:
-                subprocess.run(["explorer", str(downloads_dir())])
+                if sys.platform == "win32":
+                    os.startfile(downloads_dir())
+                else:
+                    subprocess.Popen(["xdg-open", str(downloads_dir())], close_fds=True)
+            except Exception:
+                try:
+                    subprocess.Popen(["explorer", str(downloads_dir())], close_fds=True)
+                except Exception:
+                    pass
 
     def _on_erro(self, erro: str) -> None:
         """Callback chamado quando ocorre erro na conversão."""
@@ -1789,4 +2004,5 @@ class App(ctk.CTk):
             if hasattr(self, "btn_abrir_memoria") and self.btn_abrir_memoria:
                 self.btn_abrir_memoria.configure(state="normal" if self._aprendizado_store else "disabled")
             self._progress_manager.finalizar()
+            self._btn_enabled = None  # Força reaplicar o estado do botão
             self._verificar_habilitar_botao()
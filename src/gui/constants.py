@@ -65,6 +65,25 @@ class UIConstants:
     COLOR_LOG_ACTION = "#21478A"
     COLOR_LOG_NF = "#0F172A"
 
+    # Debounce dos traces de formulário (coalesce de callbacks por caractere)
+    TRACE_DEBOUNCE_MS = 80
+
+    # Fila de logs das threads de trabalho (poller em lote na thread da UI)
+    LOG_QUEUE_POLL_MS = 50
+    LOG_QUEUE_BATCH_MAX = 50
+
+    # Fila de atualizações de UI do worker (um drain por ciclo, não um after(0)
+    # por evento)
+    UI_PUMP_MS = 30
+
+    # Tracebacks em logs DEBUG (formatar frames é caro; ligar só ao depurar)
+    LOG_DEBUG_ENABLED = False
+
+    # Limite do histórico de logs: acima de LOG_MAX_LINHAS o buffer e o
+    # textbox descartam as LOG_TRIM_LINHAS mais antigas de uma vez
+    LOG_MAX_LINHAS = 5000
+    LOG_TRIM_LINHAS = 1000
+
     # Dimensions
     LOG_FONT_SIZE_MIN = 9
     LOG_FONT_SIZE_DEFAULT = 11
@@ -192,8 +211,8 @@ class UIConstants:
     # Log
     INTERVALO_LOG_PAGINAS = 10
 
-    # Month map
-    MESES_ABREVIADOS = list(MESES_ALFANUMERICOS.values())
+    # Month map (tupla imutável: criada uma vez no import, nunca copiada)
+    MESES_ABREVIADOS = tuple(MESES_ALFANUMERICOS.values())
     MES_PADRAO = "DEZ"
     MAPA_MESES = {
         "JAN": 1,
@@ -210,6 +229,21 @@ class UIConstants:
         "DEZ": 12,
     }
 
+    # Variantes de caixa pré-computadas: o caminho comum (dropdown já em
+    # maiúsculas) resolve com uma única busca, sem alocar mes.upper()
+    MAPA_MESES_ANY = {
+        **MAPA_MESES,
+        **{mes.lower(): numero for mes, numero in MAPA_MESES.items()},
+        **{mes.title(): numero for mes, numero in MAPA_MESES.items()},
+    }
+
+    # Chaves inteiras (3 bytes ASCII como uint24): hash de palavra de máquina
+    # para o fallback de caixa mista em validar_mes
+    MAPA_MESES_INT = {
+        int.from_bytes(mes.encode("ascii"), "big"): numero
+        for mes, numero in MAPA_MESES.items()
+    }
+
     LOG_TIPOS = {
         "ERRO": COLOR_LOG_ERROR,
         "SUCESSO": COLOR_LOG_SUCCESS,
@@ -230,6 +264,11 @@ class UIConstants:
         "CRITICO": COLOR_LOG_ERROR,
     }
 
+    # Derivados congelados de LOG_TIPOS: nomes de tag prontos para o caminho
+    # quente de inserção de logs (uma busca de dict, sem f-string por linha)
+    LOG_TAG_SPECS = tuple((f"tag_{tipo}", cor) for tipo, cor in LOG_TIPOS.items())
+    LOG_TAG_FOR = {tipo: f"tag_{tipo}" for tipo in LOG_TIPOS}
+
     THEME_MODE = "Light"
     THEME_COLOR = "blue"
     THEME_OPTIONS = [TEXT_THEME_LIGHT, TEXT_THEME_DARK]
@@ -238,8 +277,8 @@ class UIConstants:
         TEXT_THEME_DARK: "Dark",
     }
 
-    FILE_TYPES_PDF = [("Arquivos PDF", "*.pdf"), ("Todos os arquivos", "*.*")]
-    FILE_TYPES_TXT = [("Arquivos TXT", "*.txt"), ("Todos os arquivos", "*.*")]
+    FILE_TYPES_PDF = (("Arquivos PDF", "*.pdf"), ("Todos os arquivos", "*.*"))
+    FILE_TYPES_TXT = (("Arquivos TXT", "*.txt"), ("Todos os arquivos", "*.*"))
     DIALOG_TITLE_PDF = "Selecione o arquivo PDF"
     DIALOG_TITLE_TXT = "Selecione o TXT corrigido"
     DIALOG_TITLE_SUCESSO = "Sucesso"
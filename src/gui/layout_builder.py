@@ -4,6 +4,7 @@ Builder da interface institucional da Rodogarcia.
 
 from __future__ import annotations
 
+import functools
 import traceback
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,7 @@ from PIL import Image
 from .constants import UIConstants
 
 
+@functools.lru_cache(maxsize=None)
 def _font(size: int, weight: str = "normal", family: str | None = None) -> ctk.CTkFont:
     return ctk.CTkFont(
         family=family or UIConstants.FONT_FAMILY_TEXT,
@@ -436,18 +438,10 @@ def setup_ui(app) -> None:
         anchor="w",
     ).grid(row=2, column=0, columnspan=2, sticky="w", pady=(12, 8))
 
-    try:
-        if not hasattr(app._filiais_manager, "obter_opcoes_combo"):
-            raise AttributeError("FiliaisManager nao possui metodo obter_opcoes_combo")
-        opcoes_filiais = app._filiais_manager.obter_opcoes_combo()
-        if opcoes_filiais and len(opcoes_filiais) > 0:
-            opcoes_combo = [UIConstants.PLACEHOLDER_COMBO_FILIAL] + opcoes_filiais
-        else:
-            opcoes_combo = [UIConstants.PLACEHOLDER_COMBO_FILIAL]
-    except Exception as e:
+    # Usa as opcoes pre-computadas no App.__init__ (cadastro estatico na sessao)
+    opcoes_combo = getattr(app, "_combo_options_cache", None)
+    if not opcoes_combo:
         opcoes_combo = [UIConstants.PLACEHOLDER_COMBO_FILIAL]
-        print(f"[ERRO] Erro ao carregar filiais no combo: {e}")
-        traceback.print_exc()
 
     app.combo_filial = ctk.CTkComboBox(
         app.frame_cnpj,
@@ -818,17 +812,9 @@ def setup_ui(app) -> None:
     app.frame_logs.rowconfigure(0, weight=1)
     app.frame_logs.grid_propagate(False)
 
-    app.textbox_logs = ctk.CTkTextbox(
-        app.frame_logs,
-        font=_font(UIConstants.LOG_FONT_SIZE_DEFAULT, family=UIConstants.FONT_FAMILY_LOGS),
-        text_color=UIConstants.COLOR_TEXT_PRIMARY,
-        fg_color=UIConstants.COLOR_BG_TEXTBOX,
-        border_width=0,
-        corner_radius=16,
-        wrap="word",
-    )
-    app.textbox_logs.grid(row=0, column=0, sticky="nsew", padx=12, pady=12)
-    app.textbox_logs.configure(state="disabled")
+    # O CTkTextbox (um Tk Text estilizado, caro de construir) fica fora do
+    # caminho do primeiro paint: App._ensure_logs_built cria sob demanda
+    app.textbox_logs = None
 
     app.cnpj_mapa.trace_add("write", app._on_cnpj_changed)
     app.ano_selecionado.trace_add("write", app._on_campo_changed)
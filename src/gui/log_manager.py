@@ -4,6 +4,8 @@ Gerenciador de logs da interface gráfica.
 
 import time
 import re
+from collections import deque
+
 import customtkinter as ctk
 from typing import Optional
 from .constants import UIConstants
@@ -25,19 +27,33 @@ class LogManager:
         """
         self.textbox = textbox
         self.frame_logs = frame_logs
-        self.logs = []
+        # Ring buffer: descarta as entradas mais antigas em O(1) para que
+        # sessões longas não cresçam a memória sem limite
+        self.logs = deque(maxlen=UIConstants.LOG_MAX_LINHAS)
         self.font_family = font_family
         self.font_size = font_size
         self.on_log_added = on_log_added
+        # Tags pré-computadas: evita reconfigurar a mesma cor a cada insert
+        self._tag_names = dict(UIConstants.LOG_TAG_FOR)
         self._font_normal = None
         self._font_bold = None
+        # Cache do timestamp formatado: sob rajadas de log, várias entradas
+        # caem no mesmo segundo e o strftime seria puro retrabalho
+        self._last_sec = -1
+        self._last_ts = ""
         self._aplicar_fonte()
         self._configurar_tags()
+        # Mantém o textbox permanentemente em state=normal: alternar
+        # normal/disabled por linha custa dois configure() no Tk por log.
+        # A edição pelo usuário é bloqueada pelos bindings abaixo.
+        self.textbox.configure(state="normal")
+        self.textbox.bind("<Key>", lambda e: "break")
+        self.textbox.bind("<<Paste>>", lambda e: "break")
+        self.textbox.bind("<Button-2>", lambda e: "break")
     
     def _configurar_tags(self):
         """Configura tags de cor para cada tipo de log."""
-        for tipo, cor in UIConstants.LOG_TIPOS.items():
-            tag_name = f"tag_{tipo}"
+        for tag_name, cor in UIConstants.LOG_TAG_SPECS:
             self.textbox.tag_config(tag_name, foreground=cor)
         # CTkTextbox não permite configurar fonte por tag (incompatível com scaling)
         if self._font_bold:
@@ -59,6 +75,22 @@ class LogManager:
             self._aplicar_fonte()
             self._configurar_tags()
 
+    def is_debug_enabled(self) -> bool:
+        """Indica se logs de DEBUG (ex.: tracebacks) devem ser formatados.
+
+        Permite que os chamadores pulem trabalho caro (format_exc percorre
+        frames) quando a saída seria descartada.
+        """
+        return UIConstants.LOG_DEBUG_ENABLED
+
+    def _timestamp(self) -> str:
+        """Retorna HH:MM:SS, reformatando só quando o segundo vira."""
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%H:%M:%S", time.localtime(sec))
+        return self._last_ts
+
     def adicionar_banner(self, titulo: str, tipo: str = "INFO"):
         """Adiciona um banner visual para separar seções."""
         linha = "=" * 60
@@ -80,38 +112,9 @@ class LogManager:
             mensagem: Mensagem a ser adicionada (pode conter quebras de linha \n)
             tipo: Tipo do log (ERRO, SUCESSO, INFO, DEBUG, AVISO)
         """
-        timestamp = time.strftime("%H:%M:%S")
-        
-        # Se a mensagem contém quebras de linha, divide em múltiplas linhas de log
-        # Cada linha terá o timestamp e tipo
-        linhas_mensagem = mensagem.split('\n')
-        
-        self.textbox.configure(state="normal")
-        
-        for i, linha_msg in enumerate(linhas_mensagem):
-            if linha_msg.strip():  # Ignora linhas vazias
-                # Primeira linha tem timestamp e tipo, linhas seguintes são continuação
-                if i == 0:
-                    log_entry = f"[{timestamp}] [{tipo}] {linha_msg}\n"
-                else:
-                    # Linhas seguintes são continuação (sem timestamp duplicado)
-                    log_entry = f"  | {linha_msg}\n"
-                
-                self.logs.append(log_entry)
-                
-                # Adiciona com tag para colorir
-                pos_inicio = self.textbox.index("end-1c")
-                self.textbox.insert("end", log_entry)
-                pos_fim = self.textbox.index("end-1c")
-                
-                # Configura tag para colorir
-                tag_name = f"tag_{tipo}"
-                cor = UIConstants.LOG_TIPOS.get(tipo, "#FFFFFF")
-                self.textbox.tag_config(tag_name, foreground=cor)
-                self.textbox.tag_add(tag_name, pos_inicio, pos_fim)
-                self._aplicar_destaques(log_entry, pos_inicio)
-        
-        self.textbox.configure(state="disabled")
+        timestamp = self._timestamp()
+
+        self._inserir_mensagem(mensagem, tipo, timestamp)
         self.textbox.see("end")  # Scroll to bottom
         # Frame de logs sempre visível no novo layout horizontal
         if self.on_log_added:
@@ -119,28 +122,87 @@ class LogManager:
                 self.on_log_added(timestamp, tipo, mensagem)
             except Exception:
                 pass
-    
-    def _aplicar_destaques(self, log_entry: str, pos_inicio: str) -> None:
+
+    def adicionar_bloco(self, entradas: list):
+        """
+        Adiciona várias mensagens com um único scroll ao final.
+
+        Amortiza o custo por linha quando um lote de logs (ex.: o banner de
+        inicialização) é conhecido de antemão.
+
+        Args:
+            entradas: Lista de tuplas (mensagem, tipo)
+        """
+        if not entradas:
+            return
+        timestamp = self._timestamp()
+
+        for mensagem, tipo in entradas:
+            self._inserir_mensagem(mensagem, tipo, timestamp)
+        self.textbox.see("end")
+        # Mantém a contagem de eventos do resumo coerente com `adicionar`
+        if self.on_log_added:
+            for mensagem, tipo in entradas:
+                try:
+                    self.on_log_added(timestamp, tipo, mensagem)
+                except Exception:
+                    pass
+
+    def _inserir_mensagem(self, mensagem: str, tipo: str, timestamp: str):
+        """Insere uma mensagem no textbox (que já deve estar em state=normal).
+
+        Todas as linhas da mensagem são inseridas de uma só vez, com a tag de
+        cor passada direto ao insert — uma ida ao Tk por mensagem, não por
+        linha.
+        """
+        # Se a mensagem contém quebras de linha, divide em múltiplas linhas de log
+        # Primeira linha tem timestamp e tipo, linhas seguintes são continuação
+        entradas = []
+        for i, linha_msg in enumerate(mensagem.split('\n')):
+            if linha_msg.strip():  # Ignora linhas vazias
+                if i == 0:
+                    entradas.append(f"[{timestamp}] [{tipo}] {linha_msg}\n")
+                else:
+                    entradas.append(f"  | {linha_msg}\n")
+        if not entradas:
+            return
+
+        self.logs.extend(entradas)
+
+        tag_name = self._tag_names.get(tipo)
+        if tag_name is None:
+            # Tipo fora de LOG_TIPOS: configura a tag uma única vez
+            tag_name = f"tag_{tipo}"
+            self.textbox.tag_config(tag_name, foreground="#FFFFFF")
+            self._tag_names[tipo] = tag_name
+
+        # Inserções em "end" sempre começam na coluna 0 de uma linha nova,
+        # então a numeração das linhas inseridas é aritmética
+        linha_no = int(self.textbox.index("end-1c").split(".")[0])
+        self.textbox.insert("end", "".join(entradas), tag_name)
+        for offset, entrada in enumerate(entradas):
+            self._aplicar_destaques(entrada, linha_no + offset)
+        # Apara o widget em blocos: o B-tree interno do Tk degrada com
+        # milhões de linhas, e deletar uma a uma seria O(N) chamadas
+        total_linhas = linha_no + len(entradas) - 1
+        if total_linhas > UIConstants.LOG_MAX_LINHAS:
+            self.textbox.delete("1.0", f"{UIConstants.LOG_TRIM_LINHAS + 1}.0")
+
+    def _aplicar_destaques(self, log_entry: str, linha_no: int) -> None:
         """Aplica destaques para NF e ACAO dentro da linha."""
         if not log_entry:
             return
         linha_limpa = log_entry.rstrip("\n")
         for match in re.finditer(r"\bNF\s+\d+\b", linha_limpa, flags=re.IGNORECASE):
-            start = self.textbox.index(f"{pos_inicio}+{match.start()}c")
-            end = self.textbox.index(f"{pos_inicio}+{match.end()}c")
-            self.textbox.tag_add("tag_nf", start, end)
+            self.textbox.tag_add("tag_nf", f"{linha_no}.{match.start()}", f"{linha_no}.{match.end()}")
         match_acao = re.search(r">\s*ACAO:", linha_limpa, flags=re.IGNORECASE)
         if match_acao:
-            start = self.textbox.index(f"{pos_inicio}+{match_acao.start()}c")
-            end = self.textbox.index(f"{pos_inicio}+{len(linha_limpa)}c")
-            self.textbox.tag_add("tag_acao", start, end)
+            self.textbox.tag_add("tag_acao", f"{linha_no}.{match_acao.start()}", f"{linha_no}.{len(linha_limpa)}")
 
     def limpar(self):
         """Limpa todos os logs."""
-        self.logs = []
-        self.textbox.configure(state="normal")
+        self.logs.clear()
         self.textbox.delete("1.0", "end")
-        self.textbox.configure(state="disabled")
         # Frame de logs sempre visível no novo layout horizontal
     
     def adicionar_erro(self, mensagem: str):
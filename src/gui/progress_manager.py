@@ -15,12 +15,17 @@ class ProgressManager:
         self.inicio_processamento: Optional[float] = None
         self.total_paginas: int = 0
         self.pagina_atual: int = 0
-    
+        # Memoiza o tempo formatado por segundo inteiro: a string só muda
+        # quando o valor exibido muda, mas formatar_tempo roda a cada tick
+        self._fmt_cache: dict = {}
+
     def iniciar(self):
         """Inicia o contador de tempo."""
-        self.inicio_processamento = time.time()
+        # monotonic: imune a ajustes do relógio do sistema durante a extração
+        self.inicio_processamento = time.monotonic()
         self.total_paginas = 0
         self.pagina_atual = 0
+        self._fmt_cache.clear()
     
     def finalizar(self):
         """Finaliza o contador de tempo."""
@@ -52,7 +57,7 @@ class ProgressManager:
             Tempo em segundos ou None se não iniciado
         """
         if self.inicio_processamento:
-            return time.time() - self.inicio_processamento
+            return time.monotonic() - self.inicio_processamento
         return None
     
     def estimar_tempo_restante(self, pagina_atual: int, total_paginas: int) -> Optional[float]:
@@ -84,16 +89,17 @@ class ProgressManager:
         Returns:
             String formatada (ex: "2min 30s", "1h 15min")
         """
-        if segundos < 60:
-            return f"{int(segundos)}s"
-        elif segundos < 3600:
-            minutos = int(segundos // 60)
-            segs = int(segundos % 60)
-            return f"{minutos}min {segs}s"
-        else:
-            horas = int(segundos // 3600)
-            minutos = int((segundos % 3600) // 60)
-            return f"{horas}h {minutos}min"
+        chave = int(segundos)
+        texto = self._fmt_cache.get(chave)
+        if texto is None:
+            if chave < 60:
+                texto = f"{chave}s"
+            elif chave < 3600:
+                texto = f"{chave // 60}min {chave % 60}s"
+            else:
+                texto = f"{chave // 3600}h {(chave % 3600) // 60}min"
+            self._fmt_cache[chave] = texto
+        return texto
     
     def deve_logar_pagina(self, pagina_atual: int, total_paginas: int) -> bool:
         """
@@ -2,14 +2,25 @@
 Utilitários para a interface gráfica.
 """
 
-from datetime import datetime
+import functools
+import re
+import time
 from pathlib import Path
 
+from unidecode import unidecode
 
+# Sanitização de nomes de arquivo: um único passe que já colapsa repetições
+_SANITIZE_RE = re.compile(r'[^A-Z0-9]+')
+
+
+@functools.lru_cache(maxsize=1)
 def downloads_dir() -> Path:
     """
     Retorna o diretório de Downloads do usuário.
-    
+
+    O resultado é memoizado: o diretório não muda durante a sessão e o
+    exists() evita um stat por chamada nos callbacks de sucesso.
+
     Returns:
         Path do diretório Downloads ou home se não existir
     """
@@ -31,30 +42,22 @@ def gerar_nome_arquivo_saida(ano: int, mes_abreviado: str, cnpj: str, nome_pdf:
     Returns:
         Nome do arquivo (ex: "M2026JAN60960473000243.txt" ou "M2026JAN60960473000243_nomepdf.txt")
     """
-    import re
-    from unidecode import unidecode
-    
     # Formato base: M{ano}{mes}{cnpj}
     nome_base = f"M{ano}{mes_abreviado.upper()}{cnpj}"
-    
+
     # Se houver nome do PDF, adiciona um sufixo único
     if nome_pdf:
         # Remove extensão .pdf
         nome_sem_ext = Path(nome_pdf).stem
-        
-        # Sanitiza o nome: remove acentos, converte para maiúscula, remove caracteres especiais
-        nome_sanitizado = unidecode(nome_sem_ext).upper()
-        nome_sanitizado = re.sub(r'[^A-Z0-9]', '_', nome_sanitizado)  # Substitui não-alfanuméricos por _
-        nome_sanitizado = re.sub(r'_+', '_', nome_sanitizado)  # Remove underscores duplicados
-        nome_sanitizado = nome_sanitizado.strip('_')  # Remove underscores nas extremidades
-        
-        # Limita o tamanho para não exceder limites do sistema de arquivos
-        if len(nome_sanitizado) > 30:
-            nome_sanitizado = nome_sanitizado[:30]
-        
+
+        # Sanitiza o nome: remove acentos, converte para maiúscula e troca
+        # sequências não-alfanuméricas por um único underscore. O tamanho é
+        # limitado para não exceder limites do sistema de arquivos.
+        nome_sanitizado = _SANITIZE_RE.sub('_', unidecode(nome_sem_ext).upper()).strip('_')[:30]
+
         # Adiciona o sufixo ao nome base
         return f"{nome_base}_{nome_sanitizado}.txt"
-    
+
     return f"{nome_base}.txt"
 
 
@@ -65,7 +68,8 @@ def extrair_ano_padrao() -> int:
     Returns:
         Ano atual (ex: 2026)
     """
-    return datetime.now().year
+    # time.localtime é mais barato que construir um datetime só para .year
+    return time.localtime().tm_year
 
 
 def extrair_mes_padrao() -> str:
@@ -76,6 +80,6 @@ def extrair_mes_padrao() -> str:
         Mês abreviado (ex: "JAN", "DEZ")
     """
     from src.gerador.layout_constants import MESES_ALFANUMERICOS
-    
-    mes_atual = datetime.now().month
+
+    mes_atual = time.localtime().tm_mon
     return MESES_ALFANUMERICOS.get(mes_atual, "DEZ")
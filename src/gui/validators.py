@@ -2,151 +2,237 @@
 Validações para formulários da interface gráfica.
 """
 
+import functools
 import os
-from pathlib import Path
+import re
 from typing import Tuple, Optional
 from src.gerador.layout_constants import CNPJ_TAMANHO, ANO_MINIMO, ANO_MAXIMO
 from .constants import UIConstants
 
+# Tabela de deleção para bytes.translate: uma passada em C sem máquina de
+# estados de regex — nos strings curtos dos callbacks de keystroke (CNPJ,
+# ano), o setup do regex domina o custo
+_NAO_DIGITOS_ASCII = bytes(i for i in range(256) if i not in b"0123456789")
+
+# Fast-path do formulário completo: CNPJ, mês e ano validados numa única
+# passada do motor de regex (o caminho lento continua produzindo as
+# mensagens de erro localizadas campo a campo)
+_FORM_RE = re.compile(r'^(\d{14})\|([A-Z]{3})\|(\d{4})$')
+
+# Dict vazio compartilhado pelos retornos de falha do formulário completo
+# (os chamadores só leem a mensagem de erro; não deve ser mutado)
+_SEM_DADOS: dict = {}
+
+# Mensagens com argumentos constantes formatadas uma única vez no import
+_ERRO_CNPJ_INVALIDO = UIConstants.TEXT_ERRO_CNPJ_INVALIDO.format(digitos=CNPJ_TAMANHO)
+_ERRO_ANO_FORA_INTERVALO = UIConstants.TEXT_ERRO_ANO_FORA_INTERVALO.format(
+    min=ANO_MINIMO, max=ANO_MAXIMO
+)
+
 
 def somente_digitos(valor: str) -> str:
     """Remove todos os caracteres não numéricos."""
-    return "".join(ch for ch in (valor or "") if ch.isdigit())
+    if not valor:
+        return ""
+    # encode("ascii", "ignore") descarta acentos/símbolos multibyte; o que
+    # sobra é filtrado pela tabela de deleção
+    return valor.encode("ascii", "ignore").translate(None, _NAO_DIGITOS_ASCII).decode("ascii")
+
+
+# Validadores puros memoizados: os traces do formulário revalidam o mesmo
+# texto repetidamente (keystroke -> valida -> exibe), e os limites ANO_* são
+# constantes de import, então o cache nunca fica obsoleto.
+def _validar_cnpj_limpo(cnpj_limpo: str) -> Tuple[bool, Optional[str]]:
+    """Valida um CNPJ que já passou por somente_digitos (evita repassar)."""
+    if len(cnpj_limpo) != CNPJ_TAMANHO:
+        return False, _ERRO_CNPJ_INVALIDO
+    return True, None
+
+
+@functools.lru_cache(maxsize=256)
+def _validar_cnpj_cached(cnpj: str) -> Tuple[bool, Optional[str]]:
+    return _validar_cnpj_limpo(somente_digitos(cnpj))
+
+
+@functools.lru_cache(maxsize=256)
+def _validar_ano_cached(ano_str: str) -> Tuple[bool, Optional[str], Optional[int]]:
+    b = somente_digitos(ano_str).encode("ascii")
+
+    if len(b) != 4:
+        return False, UIConstants.TEXT_ERRO_ANO_INVALIDO, None
+
+    # Verificação SWAR: os 4 bytes são testados de uma vez contra a faixa
+    # ASCII '0'..'9' via máscara, dispensando int() e o caminho de exceção
+    v = int.from_bytes(b, "big")
+    if (v & 0xF0F0F0F0) != 0x30303030 or ((v + 0x06060606) & 0xF0F0F0F0) != 0x30303030:
+        return False, UIConstants.TEXT_ERRO_ANO_INVALIDO_VALOR, None
+
+    ano = (b[0] - 48) * 1000 + (b[1] - 48) * 100 + (b[2] - 48) * 10 + (b[3] - 48)
+    if ano < ANO_MINIMO or ano > ANO_MAXIMO:
+        return False, _ERRO_ANO_FORA_INTERVALO, None
+    return True, None, ano
+
+
+def validar_pdf(caminho: str) -> Tuple[bool, Optional[str]]:
+    """
+    Valida se o caminho do PDF é válido.
+
+    Args:
+        caminho: Caminho do arquivo PDF
+
+    Returns:
+        Tupla (válido, mensagem_erro)
+    """
+    if not caminho:
+        return False, UIConstants.TEXT_ERRO_PDF_INVALIDO
+
+    # Sonda as pontas antes do strip: o caso comum (caminho do filedialog,
+    # sem espaços) não aloca uma cópia por revalidação
+    if caminho[0].isspace() or caminho[-1].isspace():
+        caminho = caminho.strip()
+    # Rejeições baratas primeiro: o stat() de os.path.exists só roda
+    # depois que tamanho e extensão batem (só os 4 últimos caracteres
+    # passam por lower, sem alocar o caminho inteiro)
+    if len(caminho) < 5:
+        return False, UIConstants.TEXT_ERRO_PDF_INVALIDO
+
+    if caminho[-4:].lower() != '.pdf':
+        return False, "O arquivo selecionado não é um PDF."
+
+    # isfile custa o mesmo stat que exists, mas também rejeita diretórios
+    # com nome terminando em .pdf
+    if not os.path.isfile(caminho):
+        return False, UIConstants.TEXT_ERRO_PDF_INVALIDO
+
+    return True, None
+
+
+def validar_cnpj(cnpj: str) -> Tuple[bool, Optional[str]]:
+    """
+    Valida se o CNPJ tem o tamanho correto.
+
+    Args:
+        cnpj: CNPJ a ser validado (apenas dígitos)
+
+    Returns:
+        Tupla (válido, mensagem_erro)
+    """
+    return _validar_cnpj_cached(cnpj or "")
+
+
+def validar_mes(mes: str) -> Tuple[bool, Optional[str], Optional[int]]:
+    """
+    Valida e converte mês abreviado para número.
+
+    Args:
+        mes: Mês abreviado (ex: "JAN", "DEZ")
+
+    Returns:
+        Tupla (válido, mensagem_erro, mes_numero)
+    """
+    if not mes:
+        return False, UIConstants.TEXT_ERRO_MES_NAO_SELECIONADO, None
+
+    # Busca direta primeiro (o dropdown já fornece maiúsculas); caixas
+    # mistas caem no mapa de chave inteira — os 3 bytes ASCII viram um
+    # uint24, sem alocar mes.upper()
+    mes_numero = UIConstants.MAPA_MESES_ANY.get(mes)
+    if mes_numero is None and len(mes) == 3:
+        chave = int.from_bytes(mes.encode("ascii", "ignore").upper(), "big")
+        mes_numero = UIConstants.MAPA_MESES_INT.get(chave)
+    if not mes_numero:
+        return False, UIConstants.TEXT_ERRO_MES_INVALIDO.format(mes=mes), None
+
+    return True, None, mes_numero
+
+
+def validar_ano(ano_str: str) -> Tuple[bool, Optional[str], Optional[int]]:
+    """
+    Valida e converte ano string para inteiro.
+
+    Args:
+        ano_str: Ano como string (ex: "2025")
+
+    Returns:
+        Tupla (válido, mensagem_erro, ano_numero)
+    """
+    return _validar_ano_cached(ano_str or "")
+
+
+def validar_formulario_completo(
+    pdf: str,
+    cnpj: str,
+    mes: str,
+    ano_str: str
+) -> Tuple[bool, Optional[str], dict]:
+    """
+    Valida o formulário completo.
+
+    Args:
+        pdf: Caminho do PDF
+        cnpj: CNPJ digitado
+        mes: Mês selecionado
+        ano_str: Ano digitado
+
+    Returns:
+        Tupla (válido, mensagem_erro, dados_validados)
+        dados_validados contém: pdf, cnpj, mes_numero, ano_numero
+    """
+    # Valida PDF
+    pdf_valido, erro_pdf = validar_pdf(pdf)
+    if not pdf_valido:
+        return False, erro_pdf, _SEM_DADOS
+
+    cnpj_limpo = somente_digitos(cnpj)
+
+    # Fast-path: um match de regex confirma CNPJ + mês + ano de uma vez;
+    # só resta mapear o mês e conferir o intervalo do ano
+    if mes:
+        mes_upper = mes.upper()
+        ano_limpo = somente_digitos(ano_str)
+        if _FORM_RE.match(f"{cnpj_limpo}|{mes_upper}|{ano_limpo}"):
+            mes_numero = UIConstants.MAPA_MESES.get(mes_upper)
+            ano_numero = int(ano_limpo)
+            if mes_numero and ANO_MINIMO <= ano_numero <= ANO_MAXIMO:
+                return True, None, {
+                    'pdf': pdf,
+                    'cnpj': cnpj_limpo,
+                    'mes_numero': mes_numero,
+                    'ano_numero': ano_numero,
+                    'mes_abreviado': mes_upper
+                }
+
+    # Caminho lento: revalida campo a campo para apontar o erro certo.
+    # Valida CNPJ (já limpo aqui; a variante _limpo evita repetir a
+    # remoção de dígitos dentro do validador)
+    cnpj_valido, erro_cnpj = _validar_cnpj_limpo(cnpj_limpo)
+    if not cnpj_valido:
+        return False, erro_cnpj, _SEM_DADOS
+
+    # Valida Mês
+    mes_valido, erro_mes, mes_numero = validar_mes(mes)
+    if not mes_valido:
+        return False, erro_mes, _SEM_DADOS
+
+    # Valida Ano
+    ano_valido, erro_ano, ano_numero = validar_ano(ano_str)
+    if not ano_valido:
+        return False, erro_ano, _SEM_DADOS
+
+    return True, None, {
+        'pdf': pdf,
+        'cnpj': cnpj_limpo,
+        'mes_numero': mes_numero,
+        'ano_numero': ano_numero,
+        'mes_abreviado': mes.upper()
+    }
 
 
 class FormValidator:
-    """Validador de formulários."""
-    
-    @staticmethod
-    def validar_pdf(caminho: str) -> Tuple[bool, Optional[str]]:
-        """
-        Valida se o caminho do PDF é válido.
-        
-        Args:
-            caminho: Caminho do arquivo PDF
-            
-        Returns:
-            Tupla (válido, mensagem_erro)
-        """
-        if not caminho or not caminho.strip():
-            return False, UIConstants.TEXT_ERRO_PDF_INVALIDO
-        
-        if not os.path.exists(caminho):
-            return False, UIConstants.TEXT_ERRO_PDF_INVALIDO
-        
-        if not caminho.lower().endswith('.pdf'):
-            return False, "O arquivo selecionado não é um PDF."
-        
-        return True, None
-    
-    @staticmethod
-    def validar_cnpj(cnpj: str) -> Tuple[bool, Optional[str]]:
-        """
-        Valida se o CNPJ tem o tamanho correto.
-        
-        Args:
-            cnpj: CNPJ a ser validado (apenas dígitos)
-            
-        Returns:
-            Tupla (válido, mensagem_erro)
-        """
-        cnpj_limpo = somente_digitos(cnpj)
-        from src.gerador.layout_constants import CNPJ_TAMANHO
-        if len(cnpj_limpo) != CNPJ_TAMANHO:
-            return False, UIConstants.TEXT_ERRO_CNPJ_INVALIDO.format(digitos=CNPJ_TAMANHO)
-        return True, None
-    
-    @staticmethod
-    def validar_mes(mes: str) -> Tuple[bool, Optional[str], Optional[int]]:
-        """
-        Valida e converte mês abreviado para número.
-        
-        Args:
-            mes: Mês abreviado (ex: "JAN", "DEZ")
-            
-        Returns:
-            Tupla (válido, mensagem_erro, mes_numero)
-        """
-        if not mes:
-            return False, UIConstants.TEXT_ERRO_MES_NAO_SELECIONADO, None
-        
-        mes_numero = UIConstants.MAPA_MESES.get(mes.upper())
-        if not mes_numero:
-            return False, UIConstants.TEXT_ERRO_MES_INVALIDO.format(mes=mes), None
-        
-        return True, None, mes_numero
-    
-    @staticmethod
-    def validar_ano(ano_str: str) -> Tuple[bool, Optional[str], Optional[int]]:
-        """
-        Valida e converte ano string para inteiro.
-        
-        Args:
-            ano_str: Ano como string (ex: "2025")
-            
-        Returns:
-            Tupla (válido, mensagem_erro, ano_numero)
-        """
-        ano_digitos = somente_digitos(ano_str)
-        
-        if len(ano_digitos) != 4:
-            return False, UIConstants.TEXT_ERRO_ANO_INVALIDO, None
-        
-        try:
-            ano = int(ano_digitos)
-            if ano < ANO_MINIMO or ano > ANO_MAXIMO:
-                return False, UIConstants.TEXT_ERRO_ANO_FORA_INTERVALO.format(
-                    min=ANO_MINIMO, max=ANO_MAXIMO
-                ), None
-            return True, None, ano
-        except ValueError:
-            return False, UIConstants.TEXT_ERRO_ANO_INVALIDO_VALOR, None
-    
-    @staticmethod
-    def validar_formulario_completo(
-        pdf: str, 
-        cnpj: str, 
-        mes: str, 
-        ano_str: str
-    ) -> Tuple[bool, Optional[str], dict]:
-        """
-        Valida o formulário completo.
-        
-        Args:
-            pdf: Caminho do PDF
-            cnpj: CNPJ digitado
-            mes: Mês selecionado
-            ano_str: Ano digitado
-            
-        Returns:
-            Tupla (válido, mensagem_erro, dados_validados)
-            dados_validados contém: pdf, cnpj, mes_numero, ano_numero
-        """
-        # Valida PDF
-        pdf_valido, erro_pdf = FormValidator.validar_pdf(pdf)
-        if not pdf_valido:
-            return False, erro_pdf, {}
-        
-        # Valida CNPJ
-        cnpj_limpo = somente_digitos(cnpj)
-        cnpj_valido, erro_cnpj = FormValidator.validar_cnpj(cnpj_limpo)
-        if not cnpj_valido:
-            return False, erro_cnpj, {}
-        
-        # Valida Mês
-        mes_valido, erro_mes, mes_numero = FormValidator.validar_mes(mes)
-        if not mes_valido:
-            return False, erro_mes, {}
-        
-        # Valida Ano
-        ano_valido, erro_ano, ano_numero = FormValidator.validar_ano(ano_str)
-        if not ano_valido:
-            return False, erro_ano, {}
-        
-        return True, None, {
-            'pdf': pdf,
-            'cnpj': cnpj_limpo,
-            'mes_numero': mes_numero,
-            'ano_numero': ano_numero,
-            'mes_abreviado': mes.upper()
-        }
+    """Validador de formulários (fachada; as funções vivem no módulo)."""
+
+    validar_pdf = staticmethod(validar_pdf)
+    validar_cnpj = staticmethod(validar_cnpj)
+    validar_mes = staticmethod(validar_mes)
+    validar_ano = staticmethod(validar_ano)
+    validar_formulario_completo = staticmethod(validar_formulario_completo)
@@ -12,12 +12,15 @@ Caracteristicas:
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import itertools
+import mmap
 import os
-import re
 import sqlite3
 import threading
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +29,29 @@ from typing import Dict, List, Optional, Tuple
 from ..gerador.txt_parser import parse_txt_siproquim
 from ..gerador.validators import validar_cnpj, validar_cpf
 
+# Tabela para _normalizar_nome_chave: tudo que nao for A-Z/0-9 vira espaco
+# numa unica passada de str.translate, substituindo os dois re.sub antigos
+# (a colapsagem de espacos fica por conta de " ".join(split()))
+_NOME_TRANSLATE = {
+    cp: " " for cp in range(0x80) if not (65 <= cp <= 90 or 48 <= cp <= 57)
+}
+
+# Nomes que indicam ausencia de informacao (chave vazia)
+_NOMES_VAZIOS = frozenset({"NAO INFORMADO", "SEM NOME", "N/A", "NA", "NONE", "NULL"})
+
+# Tabela de delecao para _normalizar_documento: bytes.translate varre a
+# string num laco em C, sem iterar caractere a caractere no interpretador
+# (chr(i).isdigit() reproduz o criterio do antigo filtro por ch.isdigit())
+_DELETE_NAO_DIGITOS = bytes(i for i in range(256) if not chr(i).isdigit())
+
+# Campos validos mapeiam para si mesmos: um unico dict.get substitui o
+# strip/lower + teste de pertinencia por chamada
+_CAMPO_MAP = {
+    "emitente": "emitente",
+    "contratante": "contratante",
+    "destinatario": "destinatario",
+}
+
 
 class AprendizadoStore:
     """Store SQLite com cache em memoria para consultas rapidas."""
@@ -65,15 +91,28 @@ class AprendizadoStore:
         self._lock = threading.Lock()
         self._db_path = Path(db_path) if db_path else self._resolver_caminho_db()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._nome_para_docs: Dict[str, Dict[str, Dict[str, object]]] = {}
-        self._doc_para_nomes: Dict[str, Dict[str, Dict[str, object]]] = {}
-        self._nome_para_docs_por_campo: Dict[str, Dict[str, Dict[str, Dict[str, object]]]] = {}
-        self._doc_para_nomes_por_campo: Dict[str, Dict[str, Dict[str, Dict[str, object]]]] = {}
+        # Conexao persistente por thread: abrir/fechar a cada consulta custa
+        # open() + parse do arquivo, o que domina queries pontuais como
+        # existe_documento
+        self._tls = threading.local()
+
+        # Layout enxuto dos caches: o sentido nome->doc guarda apenas a
+        # contagem (int) e o sentido doc->nome uma tupla (nome_original,
+        # contagem), em vez de um dict {"nome_original","ocorrencias"} por
+        # entrada — menos alocacoes por par e ranking direto sobre ints
+        self._nome_para_docs: Dict[str, Dict[str, int]] = {}
+        self._doc_para_nomes: Dict[str, Dict[str, Tuple[str, int]]] = {}
+        self._nome_para_docs_por_campo: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._doc_para_nomes_por_campo: Dict[str, Dict[str, Dict[str, Tuple[str, int]]]] = {}
         self._totais_status: Dict[str, int] = {
             self.STATUS_ATIVO: 0,
             self.STATUS_QUARENTENA: 0,
         }
+        # Resumo agregado memoizado; invalidado quando uma sessao grava
+        self._resumo_cache: Optional[Dict[str, object]] = None
+        # Impressao digital de learned_pairs na ultima reconstrucao do
+        # cache: se nada mudou no banco, _recarregar_cache vira um no-op
+        self._cache_fingerprint: Optional[Tuple] = None
 
         self._inicializar_schema()
         self._recarregar_cache()
@@ -88,6 +127,11 @@ class AprendizadoStore:
 
     def resumo_memoria(self) -> Dict[str, object]:
         """Retorna resumo util para logs/UI."""
+        # Cache invalidado apenas por escrita: a agregacao so roda de novo
+        # depois de um aprendizado, nao a cada refresh da UI
+        resumo = self._resumo_cache
+        if resumo is not None:
+            return dict(resumo)
         with self._connection() as conn:
             cur = conn.cursor()
             cur.execute(
@@ -108,7 +152,7 @@ class AprendizadoStore:
             total_docs = int(row[2] or 0)
             pares_ativos = int(row[3] or 0)
             pares_quarentena = int(row[4] or 0)
-        return {
+        resumo = {
             "arquivo_db": str(self._db_path),
             "pasta_memoria": str(self.memory_folder),
             "total_pares": total_pares,
@@ -117,6 +161,8 @@ class AprendizadoStore:
             "pares_ativos": pares_ativos,
             "pares_quarentena": pares_quarentena,
         }
+        self._resumo_cache = resumo
+        return dict(resumo)
 
     def buscar_documento_por_nome(self, nome: str, campo: Optional[str] = None) -> Optional[str]:
         """
@@ -154,24 +200,25 @@ class AprendizadoStore:
         if not candidatos:
             return None
 
-        ranking = sorted(
-            (
-                (
-                    nome_key,
-                    str(info.get("nome_original", "")).strip(),
-                    int(info.get("ocorrencias", 0)),
-                )
-                for nome_key, info in candidatos.items()
-            ),
-            key=lambda x: x[2],
-            reverse=True,
-        )
-        if not ranking:
+        # So lider e vice importam para a regra de margem: uma passada
+        # rastreando os dois maiores dispensa ordenar o ranking inteiro
+        top_nome: Optional[str] = None
+        top_count = 0
+        sec_count = 0
+        for nome_original, count in candidatos.values():
+            if top_nome is None or count > top_count:
+                sec_count = top_count
+                top_nome = nome_original
+                top_count = count
+            elif count > sec_count:
+                sec_count = count
+
+        if top_nome is None:
             return None
-        if len(ranking) == 1:
-            return ranking[0][1]
-        if ranking[0][2] >= ranking[1][2] + self.CONFLITO_MARGEM:
-            return ranking[0][1]
+        if len(candidatos) == 1:
+            return top_nome
+        if top_count >= sec_count + self.CONFLITO_MARGEM:
+            return top_nome
         return None
 
     def existe_documento(self, documento: str) -> bool:
@@ -193,6 +240,13 @@ class AprendizadoStore:
         Retorna resumo detalhado para ser exibido no log da GUI.
         """
         caminho_resolvido = str(Path(caminho_txt).resolve())
+
+        # Fast-path de replay: se tamanho e mtime batem com uma sessao ja
+        # gravada, o arquivo nao mudou — dispensa hash e parse completos
+        replay = self._buscar_replay_por_stat(caminho_resolvido)
+        if replay is not None:
+            return replay
+
         arquivo_sha256 = self._calcular_sha256_arquivo(caminho_resolvido)
         dados = parse_txt_siproquim(caminho_txt)
         registros_tn = list(dados.get("tn", []))
@@ -231,11 +285,17 @@ class AprendizadoStore:
                         "documento": doc,
                         "tipo_documento": tipo_doc,
                         "ocorrencias": 0,
-                        "nfs": set(),
+                        # Lista limitada em vez de set: a amostra de NFs so
+                        # alimenta um join truncado em 120 caracteres, entao
+                        # nao vale pagar um set por candidato
+                        "nfs": [],
+                        "nf_len": 0,
                     },
                 )
                 item["ocorrencias"] = int(item["ocorrencias"]) + 1
-                item["nfs"].add(nf)
+                if int(item["nf_len"]) < 120 and nf not in item["nfs"]:
+                    item["nfs"].append(nf)
+                    item["nf_len"] = int(item["nf_len"]) + len(nf) + 1
 
         resumo = self._persistir_aprendizado(
             caminho_resolvido,
@@ -245,10 +305,71 @@ class AprendizadoStore:
             ignorados,
             invalidas,
         )
+        grupos_tocados = resumo.pop("_grupos_tocados", None)
         if not resumo.get("replay_detectado", False):
-            self._recarregar_cache()
+            if grupos_tocados:
+                self._atualizar_cache_grupos(grupos_tocados)
+            else:
+                self._recarregar_cache()
         return resumo
 
+    def _buscar_replay_por_stat(self, caminho_resolvido: str) -> Optional[Dict[str, object]]:
+        """
+        Detecta replay por (caminho, tamanho, mtime) sem ler o arquivo.
+
+        Retorna o resumo de replay quando uma sessao anterior bate com o
+        stat atual, ou None para seguir pelo caminho completo (hash+parse).
+        """
+        try:
+            st = os.stat(caminho_resolvido)
+        except OSError:
+            return None
+
+        with self._connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                SELECT id, processado_em, arquivo_txt, arquivo_sha256,
+                       total_tn, candidatos, ignorados, linhas_invalidas
+                FROM learn_sessions
+                WHERE arquivo_txt = ? AND arquivo_size = ? AND arquivo_mtime = ?
+                ORDER BY id DESC
+                LIMIT 1
+                """,
+                (caminho_resolvido, st.st_size, st.st_mtime),
+            )
+            row = cur.fetchone()
+
+        if row is None:
+            return None
+
+        sessao_id = int(row["id"])
+        processado_em = str(row["processado_em"] or "")
+        return {
+            "arquivo_txt": caminho_resolvido,
+            "arquivo_db": str(self._db_path),
+            "pasta_memoria": str(self.memory_folder),
+            "arquivo_sha256": str(row["arquivo_sha256"] or ""),
+            "total_tn": int(row["total_tn"] or 0),
+            "candidatos": int(row["candidatos"] or 0),
+            "aprendidos_novos": 0,
+            "atualizados": 0,
+            "promovidos": 0,
+            "rebaixados": 0,
+            "ativos_sessao": 0,
+            "quarentena_sessao": 0,
+            "ignorados": int(row["ignorados"] or 0),
+            "linhas_invalidas": int(row["linhas_invalidas"] or 0),
+            "replay_detectado": True,
+            "sessao_referencia_id": sessao_id,
+            "sessao_referencia_data": processado_em,
+            "sessao_referencia_arquivo": str(row["arquivo_txt"] or ""),
+            "detalhes": [
+                f"[REPLAY] Arquivo ja aprendido (sessao #{sessao_id} em {processado_em}). "
+                "Nenhuma alteracao aplicada."
+            ],
+        }
+
     def _persistir_aprendizado(
         self,
         caminho_txt: str,
@@ -312,19 +433,34 @@ class AprendizadoStore:
                     ],
                 }
 
+            # BEGIN IMMEDIATE toma o write-lock de uma vez e agrupa toda a
+            # sessao num unico commit/fsync; sem ele, outro escritor poderia
+            # se intrometer entre as leituras e as escritas abaixo
+            cur.execute("BEGIN IMMEDIATE")
+
+            try:
+                st = os.stat(origem_arquivo)
+                arquivo_size: Optional[int] = st.st_size
+                arquivo_mtime: Optional[float] = st.st_mtime
+            except OSError:
+                arquivo_size = None
+                arquivo_mtime = None
+
             cur.execute(
                 """
                 INSERT INTO learn_sessions
                 (
-                    arquivo_txt, arquivo_sha256, processado_em,
-                    total_tn, candidatos, aprendidos, atualizados,
-                    ignorados, linhas_invalidas
+                    arquivo_txt, arquivo_sha256, arquivo_size, arquivo_mtime,
+                    processado_em, total_tn, candidatos, aprendidos,
+                    atualizados, ignorados, linhas_invalidas
                 )
-                VALUES (?, ?, ?, ?, ?, 0, 0, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 0, 0, ?, ?)
                 """,
                 (
                     origem_arquivo,
                     arquivo_sha256,
+                    arquivo_size,
+                    arquivo_mtime,
                     agora,
                     len(registros_tn),
                     len(candidatos),
@@ -334,6 +470,7 @@ class AprendizadoStore:
             )
             session_id = int(cur.lastrowid)
 
+            itens: List[Tuple[str, str, str, str, str, int, str]] = []
             for item in sorted(
                 candidatos.values(),
                 key=lambda x: (
@@ -342,39 +479,57 @@ class AprendizadoStore:
                     str(x.get("documento", "")),
                 ),
             ):
-                nome_key = str(item["nome_key"])
-                doc = str(item["documento"])
-                campo = str(item["campo"])
-                nome_original = str(item["nome_original"])
-                tipo_doc = str(item["tipo_documento"])
-                inc = int(item["ocorrencias"])
-                nf_amostra = ",".join(sorted(item["nfs"]))[:120]
-                campo_norm = self._normalizar_campo(campo)
+                campo_norm = self._normalizar_campo(str(item["campo"]))
                 if not campo_norm:
                     continue
+                itens.append(
+                    (
+                        str(item["nome_key"]),
+                        str(item["documento"]),
+                        campo_norm,
+                        str(item["nome_original"]),
+                        str(item["tipo_documento"]),
+                        int(item["ocorrencias"]),
+                        ",".join(sorted(item["nfs"]))[:120],
+                    )
+                )
 
+            # Busca os pares existentes de uma vez (por nome_key, filtrando o
+            # restante em memória) em vez de uma SELECT por candidato
+            existentes: Dict[Tuple[str, str, str], Tuple[int, str]] = {}
+            nomes_envolvidos = sorted({nome_key for nome_key, _, _, _, _, _, _ in itens})
+            for inicio in range(0, len(nomes_envolvidos), 500):
+                lote = nomes_envolvidos[inicio:inicio + 500]
+                marcadores = ",".join("?" * len(lote))
                 cur.execute(
-                    """
-                    SELECT ocorrencias, status
+                    f"""
+                    SELECT nome_key, documento, campo, ocorrencias, status
                     FROM learned_pairs
-                    WHERE nome_key = ? AND documento = ? AND campo = ?
+                    WHERE nome_key IN ({marcadores})
                     """,
-                    (nome_key, doc, campo_norm),
+                    lote,
                 )
-                row = cur.fetchone()
-                status_anterior = self.STATUS_QUARENTENA
+                for row in cur.fetchall():
+                    existentes[(str(row["nome_key"]), str(row["documento"]), str(row["campo"]))] = (
+                        int(row["ocorrencias"] or 0),
+                        self._normalizar_status(row["status"]),
+                    )
 
-                if row is None:
-                    cur.execute(
-                        """
-                        INSERT INTO learned_pairs
-                        (
-                            nome_key, nome_original, documento, tipo_documento, campo,
-                            ocorrencias, status, status_motivo,
-                            origem_arquivo, primeira_ocorrencia, ultima_ocorrencia
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+            # Contagens por (nome_key, campo) mescladas em memória: semeadas
+            # com o que já existe no banco e atualizadas com os incrementos
+            # da sessão, alimentam a reclassificação sem releitura por grupo
+            grupos: Dict[Tuple[str, str], Dict[str, int]] = {}
+            for (nome_key, doc, campo_norm), (total, _status) in existentes.items():
+                grupos.setdefault((nome_key, campo_norm), {})[doc] = total
+
+            inserir_rows: List[Tuple] = []
+            atualizar_rows: List[Tuple] = []
+            for nome_key, doc, campo_norm, nome_original, tipo_doc, inc, nf_amostra in itens:
+                existente = existentes.get((nome_key, doc, campo_norm))
+                if existente is None:
+                    status_anterior = self.STATUS_QUARENTENA
+                    grupos.setdefault((nome_key, campo_norm), {})[doc] = inc
+                    inserir_rows.append(
                         (
                             nome_key,
                             nome_original,
@@ -387,29 +542,24 @@ class AprendizadoStore:
                             origem_arquivo,
                             agora,
                             agora,
-                        ),
+                        )
                     )
                     acao_base = "novo"
                     aprendidos += 1
                 else:
-                    status_anterior = self._normalizar_status(row["status"])
-                    total = int(row["ocorrencias"] or 0) + inc
-                    cur.execute(
-                        """
-                        UPDATE learned_pairs
-                        SET nome_original = ?, tipo_documento = ?, ocorrencias = ?, origem_arquivo = ?, ultima_ocorrencia = ?
-                        WHERE nome_key = ? AND documento = ? AND campo = ?
-                        """,
+                    total_anterior, status_anterior = existente
+                    grupos[(nome_key, campo_norm)][doc] = total_anterior + inc
+                    atualizar_rows.append(
                         (
                             nome_original,
                             tipo_doc,
-                            total,
+                            total_anterior + inc,
                             origem_arquivo,
                             agora,
                             nome_key,
                             doc,
                             campo_norm,
-                        ),
+                        )
                     )
                     acao_base = "atualizado"
                     atualizados += 1
@@ -429,28 +579,74 @@ class AprendizadoStore:
                     }
                 )
 
+            # executemany despacha o lote numa única travessia Python->C
+            if inserir_rows:
+                cur.executemany(
+                    """
+                    INSERT INTO learned_pairs
+                    (
+                        nome_key, nome_original, documento, tipo_documento, campo,
+                        ocorrencias, status, status_motivo,
+                        origem_arquivo, primeira_ocorrencia, ultima_ocorrencia
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    inserir_rows,
+                )
+            if atualizar_rows:
+                cur.executemany(
+                    """
+                    UPDATE learned_pairs
+                    SET nome_original = ?, tipo_documento = ?, ocorrencias = ?, origem_arquivo = ?, ultima_ocorrencia = ?
+                    WHERE nome_key = ? AND documento = ? AND campo = ?
+                    """,
+                    atualizar_rows,
+                )
+
+            # Reclassificação em memória: as contagens finais já estão em
+            # `grupos`, então o status de cada documento é decidido sem
+            # nenhuma SELECT por grupo e gravado num único executemany
+            resultados_grupo: Dict[Tuple[str, str], Dict[str, Tuple[str, int]]] = {}
+            status_rows: List[Tuple[str, str, str, str, str]] = []
             for nome_key, campo in grupos_tocados:
-                self._reclassificar_nome_campo(cur, nome_key, campo, agora)
+                contagens = grupos.get((nome_key, campo))
+                if not contagens:
+                    continue
+                escolhido = self._selecionar_documento_por_confianca(contagens, campo=campo)
+                resultado: Dict[str, Tuple[str, int]] = {}
+                for doc, total in contagens.items():
+                    if escolhido is None:
+                        status, motivo = self.STATUS_QUARENTENA, "baixa_confianca"
+                    elif doc == escolhido:
+                        status, motivo = self.STATUS_ATIVO, "confianca_suficiente"
+                    else:
+                        status, motivo = self.STATUS_QUARENTENA, "conflito_ou_baixa_confianca"
+                    resultado[doc] = (status, total)
+                    status_rows.append((status, motivo, nome_key, campo, doc))
+                resultados_grupo[(nome_key, campo)] = resultado
+
+            if status_rows:
+                cur.executemany(
+                    """
+                    UPDATE learned_pairs
+                    SET status = ?, status_motivo = ?
+                    WHERE nome_key = ? AND campo = ? AND documento = ?
+                    """,
+                    status_rows,
+                )
 
+            itens_sessao: List[Tuple] = []
             for item in pendentes:
                 nome_key = str(item["nome_key"])
                 doc = str(item["documento"])
                 campo = str(item["campo"])
                 status_anterior = self._normalizar_status(str(item["status_anterior"]))
 
-                cur.execute(
-                    """
-                    SELECT ocorrencias, status
-                    FROM learned_pairs
-                    WHERE nome_key = ? AND documento = ? AND campo = ?
-                    """,
-                    (nome_key, doc, campo),
-                )
-                row = cur.fetchone()
-                if row is None:
+                resultado = resultados_grupo.get((nome_key, campo), {}).get(doc)
+                if resultado is None:
                     continue
-                total = int(row["ocorrencias"] or 0)
-                status_final = self._normalizar_status(row["status"])
+                status_final, total = resultado
+                status_final = self._normalizar_status(status_final)
 
                 if status_final == self.STATUS_ATIVO:
                     ativos_sessao += 1
@@ -468,12 +664,7 @@ class AprendizadoStore:
                     status_final=status_final,
                 )
 
-                cur.execute(
-                    """
-                    INSERT INTO learn_session_items
-                    (session_id, campo, nome_original, nome_key, documento, tipo_documento, acao, ocorrencias_arquivo, ocorrencias_total, nf_amostra)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                itens_sessao.append(
                     (
                         session_id,
                         campo,
@@ -485,7 +676,7 @@ class AprendizadoStore:
                         int(item["ocorrencias_arquivo"]),
                         total,
                         str(item["nf_amostra"]),
-                    ),
+                    )
                 )
 
                 if len(detalhes) < 40:
@@ -495,6 +686,16 @@ class AprendizadoStore:
                         f"NF={item['nf_amostra'] or 'N/A'})"
                     )
 
+            if itens_sessao:
+                cur.executemany(
+                    """
+                    INSERT INTO learn_session_items
+                    (session_id, campo, nome_original, nome_key, documento, tipo_documento, acao, ocorrencias_arquivo, ocorrencias_total, nf_amostra)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    itens_sessao,
+                )
+
             cur.execute(
                 """
                 UPDATE learn_sessions
@@ -505,6 +706,11 @@ class AprendizadoStore:
             )
             conn.commit()
 
+        # A sessao mudou os agregados: proximo resumo_memoria reconsulta e
+        # a proxima reconstrucao de cache nao pode ser pulada pela guarda
+        self._resumo_cache = None
+        self._cache_fingerprint = None
+
         return {
             "arquivo_txt": origem_arquivo,
             "arquivo_db": str(self._db_path),
@@ -522,6 +728,8 @@ class AprendizadoStore:
             "linhas_invalidas": invalidas,
             "replay_detectado": False,
             "detalhes": detalhes,
+            # Uso interno: permite atualizacao incremental do cache
+            "_grupos_tocados": grupos_tocados,
         }
 
     def _resolver_caminho_db(self) -> Path:
@@ -545,34 +753,59 @@ class AprendizadoStore:
     @staticmethod
     def _calcular_sha256_arquivo(caminho_txt: str) -> str:
         """Calcula hash SHA-256 do arquivo para detectar replay de aprendizado."""
-        digest = hashlib.sha256()
         with open(caminho_txt, "rb") as arquivo:
-            for bloco in iter(lambda: arquivo.read(1024 * 1024), b""):
-                digest.update(bloco)
-        return digest.hexdigest()
-
+            # file_digest (3.11+) faz o laco read+update em C, sem passar
+            # cada bloco pelo interpretador e liberando o GIL
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(arquivo, "sha256").hexdigest()
+            # Pythons antigos: mmap entrega o arquivo inteiro numa unica
+            # chamada de sha256, sem copias bloco a bloco no interpretador
+            try:
+                with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.sha256(mm).hexdigest()
+            except (ValueError, OSError):
+                # Arquivo vazio ou sistema sem mmap: laco de blocos
+                digest = hashlib.sha256()
+                for bloco in iter(lambda: arquivo.read(1024 * 1024), b""):
+                    digest.update(bloco)
+                return digest.hexdigest()
+
+    # Memoizados: aprender_com_txt repete os mesmos contratantes/emitentes
+    # em dezenas de TNs e a GUI revalida os mesmos nomes a cada lookup
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def _normalizar_nome_chave(nome: str) -> str:
         if not nome:
             return ""
-        texto = unicodedata.normalize("NFD", str(nome).upper())
-        texto = "".join(ch for ch in texto if unicodedata.category(ch) != "Mn")
-        texto = re.sub(r"[^A-Z0-9]+", " ", texto)
-        texto = re.sub(r"\s+", " ", texto).strip()
-        if texto in {"NAO INFORMADO", "SEM NOME", "N/A", "NA", "NONE", "NULL"}:
+        texto = str(nome).upper()
+        # Caminho Unicode so quando necessario: nomes ASCII (a maioria apos
+        # o parse) pulam a decomposicao NFD inteira
+        if not texto.isascii():
+            texto = unicodedata.normalize("NFD", texto)
+            texto = "".join(ch for ch in texto if unicodedata.category(ch) != "Mn")
+            # "replace" troca os simbolos fora do ASCII restantes por '?',
+            # que a tabela converte em espaco (mesmo efeito do regex antigo)
+            texto = texto.encode("ascii", "replace").decode("ascii")
+        texto = " ".join(texto.translate(_NOME_TRANSLATE).split())
+        if texto in _NOMES_VAZIOS:
             return ""
         return texto
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def _normalizar_documento(documento: str) -> str:
-        return "".join(ch for ch in str(documento or "") if ch.isdigit())
+        return (
+            str(documento or "")
+            .encode("latin-1", "ignore")
+            .translate(None, _DELETE_NAO_DIGITOS)
+            .decode("latin-1")
+        )
 
     @staticmethod
     def _normalizar_campo(campo: str) -> str:
-        texto = str(campo or "").strip().lower()
-        if texto in {"emitente", "contratante", "destinatario"}:
-            return texto
-        return ""
+        # Caso comum: o chamador ja passa o literal canonico
+        texto = str(campo or "")
+        return _CAMPO_MAP.get(texto) or _CAMPO_MAP.get(texto.strip().lower(), "")
 
     def _normalizar_status(self, status: object) -> str:
         texto = str(status or "").strip().lower()
@@ -596,94 +829,42 @@ class AprendizadoStore:
             return f"{base}_ATIVO"
         return f"{base}_QUARENTENA"
 
-    def _reclassificar_nome_campo(
-        self,
-        cur: sqlite3.Cursor,
-        nome_key: str,
-        campo: str,
-        _agora: str,
-    ) -> None:
-        """
-        Reclassifica todos os documentos de um (nome, campo) em ativo/quarentena.
-
-        Regra:
-        - somente um documento pode ficar ATIVO;
-        - se nao houver confianca suficiente, todos ficam em QUARENTENA.
-        """
-        campo_norm = self._normalizar_campo(campo)
-        if not campo_norm:
-            return
-
-        cur.execute(
-            """
-            SELECT documento, ocorrencias
-            FROM learned_pairs
-            WHERE nome_key = ? AND campo = ?
-            """,
-            (nome_key, campo_norm),
-        )
-        rows = cur.fetchall()
-        if not rows:
-            return
-
-        candidatos = {
-            str(row["documento"]): {"ocorrencias": int(row["ocorrencias"] or 0)}
-            for row in rows
-        }
-        escolhido = self._selecionar_documento_por_confianca(candidatos, campo=campo_norm)
-
-        if escolhido:
-            cur.execute(
-                """
-                UPDATE learned_pairs
-                SET status = ?, status_motivo = ?
-                WHERE nome_key = ? AND campo = ? AND documento = ?
-                """,
-                (self.STATUS_ATIVO, "confianca_suficiente", nome_key, campo_norm, escolhido),
-            )
-            cur.execute(
-                """
-                UPDATE learned_pairs
-                SET status = ?, status_motivo = ?
-                WHERE nome_key = ? AND campo = ? AND documento <> ?
-                """,
-                (self.STATUS_QUARENTENA, "conflito_ou_baixa_confianca", nome_key, campo_norm, escolhido),
-            )
-            return
-
-        cur.execute(
-            """
-            UPDATE learned_pairs
-            SET status = ?, status_motivo = ?
-            WHERE nome_key = ? AND campo = ?
-            """,
-            (self.STATUS_QUARENTENA, "baixa_confianca", nome_key, campo_norm),
-        )
-
     def _selecionar_documento_por_confianca(
         self,
-        candidatos: Dict[str, Dict[str, object]],
+        candidatos: Dict[str, int],
         campo: Optional[str] = None,
     ) -> Optional[str]:
-        """Seleciona documento apenas quando ha confianca suficiente."""
-        ranking = sorted(
-            ((doc, int(info.get("ocorrencias", 0))) for doc, info in candidatos.items()),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-        if not ranking:
+        """Seleciona documento apenas quando ha confianca suficiente.
+
+        Recebe {documento: ocorrencias} ja reduzido a inteiros.
+        """
+        if not candidatos:
             return None
-        top_doc, top_count = ranking[0]
-        sec_count = ranking[1][1] if len(ranking) > 1 else 0
-        total_count = sum(count for _, count in ranking)
 
-        if len(ranking) > 1 and top_count < sec_count + self.CONFLITO_MARGEM:
+        # Só líder e vice importam para a regra de margem: uma passada
+        # rastreando os dois maiores substitui o sort completo do ranking
+        # (e soma o total na mesma varredura)
+        top_doc: Optional[str] = None
+        top_count = 0
+        sec_count = 0
+        total_count = 0
+        for doc, count in candidatos.items():
+            total_count += count
+            if top_doc is None or count > top_count:
+                sec_count = top_count
+                top_doc = doc
+                top_count = count
+            elif count > sec_count:
+                sec_count = count
+
+        if len(candidatos) > 1 and top_count < sec_count + self.CONFLITO_MARGEM:
             return None
 
-        campo_key = self._normalizar_campo(campo or "")
-        if campo_key:
-            min_occ = int(self.MIN_OCORRENCIAS_POR_CAMPO.get(campo_key, 1))
-            min_ratio = float(self.MIN_RAZAO_LIDER_POR_CAMPO.get(campo_key, 0.0))
+        # Todos os chamadores internos ja passam o campo canonico (ou None),
+        # entao nao ha por que normalizar de novo aqui
+        if campo:
+            min_occ = int(self.MIN_OCORRENCIAS_POR_CAMPO.get(campo, 1))
+            min_ratio = float(self.MIN_RAZAO_LIDER_POR_CAMPO.get(campo, 0.0))
             ratio = (top_count / total_count) if total_count else 0.0
             if top_count < min_occ:
                 return None
@@ -702,15 +883,44 @@ class AprendizadoStore:
 
     @contextmanager
     def _connection(self):
+        # A conexão é persistente: não fecha ao sair do bloco. Em caso de
+        # erro, desfaz a transação pendente (o close antigo fazia isso
+        # implicitamente) para não vazar escritas parciais para o próximo uso.
         conn = self._connect()
         try:
             yield conn
-        finally:
-            conn.close()
+        except Exception:
+            conn.rollback()
+            raise
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
+        # Uma conexão por thread, criada sob demanda e reaproveitada: abrir
+        # o arquivo SQLite a cada chamada custava open() + leitura do header
+        # em toda consulta pontual (ex.: existe_documento em loop)
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            # cached_statements acima do padrao (100): entre consultas de
+            # cache, persistencia e migracao ha mais formas de SQL vivas do
+            # que o cache default de prepared statements comporta
+            conn = sqlite3.connect(str(self._db_path), cached_statements=512)
+            conn.row_factory = sqlite3.Row
+            # WAL permite leituras concorrentes às escritas e troca o
+            # rollback journal por appends sequenciais; synchronous=NORMAL
+            # é seguro em WAL (perda máxima: última transação em queda de
+            # energia, nunca corrupção). Os demais dimensionam cache e
+            # temporários para a carga de aprendizado em lote.
+            cur = conn.cursor()
+            # Dois escritores simultaneos (ex.: aprendizado em duas janelas)
+            # esperam o lock em vez de falhar com "database is locked"
+            cur.execute("PRAGMA busy_timeout=30000")
+            cur.execute("PRAGMA journal_mode=WAL")
+            cur.execute("PRAGMA synchronous=NORMAL")
+            cur.execute("PRAGMA temp_store=MEMORY")
+            cur.execute("PRAGMA cache_size=-65536")
+            cur.execute("PRAGMA mmap_size=268435456")
+            cur.execute("PRAGMA foreign_keys=ON")
+            cur.close()
+            self._tls.conn = conn
         return conn
 
     def _inicializar_schema(self) -> None:
@@ -769,7 +979,15 @@ class AprendizadoStore:
                 """
             )
             cur.execute("CREATE INDEX IF NOT EXISTS idx_learned_pairs_doc ON learned_pairs(documento)")
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_learned_pairs_nome ON learned_pairs(nome_key)")
+            # Índice cobridor para a reclassificação por (nome_key, campo):
+            # documento e ocorrencias entram como colunas finais, então a
+            # consulta é respondida só pelo índice, sem tocar a tabela.
+            # Substitui o antigo idx_learned_pairs_nome (prefixo redundante).
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_learned_pairs_nome_campo "
+                "ON learned_pairs(nome_key, campo, documento, ocorrencias)"
+            )
+            cur.execute("DROP INDEX IF EXISTS idx_learned_pairs_nome")
             cur.execute("CREATE INDEX IF NOT EXISTS idx_learn_items_session ON learn_session_items(session_id)")
 
             cur.execute("PRAGMA table_info(learned_pairs)")
@@ -781,13 +999,32 @@ class AprendizadoStore:
             if "status_motivo" not in colunas:
                 cur.execute("ALTER TABLE learned_pairs ADD COLUMN status_motivo TEXT")
 
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_learned_pairs_status ON learned_pairs(status)")
+            # Índice cobridor para a reconstrução do cache: as consultas
+            # filtram por status e leem apenas estas colunas, então o scan
+            # roda inteiro no índice, sem o salto por rowid para a tabela a
+            # cada linha. Substitui o antigo idx_learned_pairs_status
+            # (prefixo redundante; o GROUP BY status também usa este).
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_learned_pairs_cache "
+                "ON learned_pairs(status, campo, nome_key, documento, nome_original, ocorrencias)"
+            )
+            cur.execute("DROP INDEX IF EXISTS idx_learned_pairs_status")
 
             cur.execute("PRAGMA table_info(learn_sessions)")
             colunas_sessao = {str(row[1]) for row in cur.fetchall()}
             if "arquivo_sha256" not in colunas_sessao:
                 cur.execute("ALTER TABLE learn_sessions ADD COLUMN arquivo_sha256 TEXT")
+            # Tamanho + mtime permitem detectar replay sem reler o arquivo
+            # inteiro para calcular o hash
+            if "arquivo_size" not in colunas_sessao:
+                cur.execute("ALTER TABLE learn_sessions ADD COLUMN arquivo_size INTEGER")
+            if "arquivo_mtime" not in colunas_sessao:
+                cur.execute("ALTER TABLE learn_sessions ADD COLUMN arquivo_mtime REAL")
             cur.execute("CREATE INDEX IF NOT EXISTS idx_learn_sessions_sha256 ON learn_sessions(arquivo_sha256)")
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_learn_sessions_arquivo "
+                "ON learn_sessions(arquivo_txt, arquivo_size, arquivo_mtime)"
+            )
 
             cur.execute(
                 """
@@ -796,38 +1033,115 @@ class AprendizadoStore:
                 WHERE arquivo_sha256 IS NULL OR arquivo_sha256 = ''
                 """
             )
-            for row in cur.fetchall():
-                sessao_id = int(row[0])
-                arquivo_txt = str(row[1] or "").strip()
-                if not arquivo_txt:
-                    continue
-                try:
-                    caminho = Path(arquivo_txt)
-                    if not caminho.exists():
-                        continue
-                    sha = self._calcular_sha256_arquivo(str(caminho))
-                    cur.execute(
+            # fetchmany em lotes: transfere as linhas em blocos de 500 na
+            # fronteira C->Python (em vez de materializar o historico
+            # inteiro de uma vez com fetchall), filtrando no mesmo passe
+            cur.arraysize = 500
+            pendentes_hash: List[Tuple[int, str]] = []
+            while True:
+                lote_rows = cur.fetchmany()
+                if not lote_rows:
+                    break
+                for sessao_id, arquivo_txt in lote_rows:
+                    arquivo_txt = str(arquivo_txt or "").strip()
+                    if arquivo_txt:
+                        pendentes_hash.append((int(sessao_id), arquivo_txt))
+            if pendentes_hash:
+                def _hash_sessao(item: Tuple[int, str]) -> Optional[Tuple[str, int]]:
+                    sessao_id, arquivo_txt = item
+                    try:
+                        caminho = Path(arquivo_txt)
+                        if not caminho.exists():
+                            return None
+                        return self._calcular_sha256_arquivo(str(caminho)), sessao_id
+                    except Exception:
+                        # Sessao historica sem arquivo disponivel: mantem sem hash.
+                        return None
+
+                # hashlib libera o GIL durante o update: hashear os arquivos
+                # em paralelo sobrepoe a E/S; as atualizacoes vao ao banco
+                # num unico executemany dentro da mesma transacao
+                if len(pendentes_hash) == 1:
+                    resultados = [_hash_sessao(pendentes_hash[0])]
+                else:
+                    max_workers = min(8, (os.cpu_count() or 1) * 2)
+                    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                        resultados = list(pool.map(_hash_sessao, pendentes_hash))
+                atualizacoes = [item for item in resultados if item is not None]
+                if atualizacoes:
+                    cur.executemany(
                         "UPDATE learn_sessions SET arquivo_sha256 = ? WHERE id = ?",
-                        (sha, sessao_id),
+                        atualizacoes,
                     )
-                except Exception:
-                    # Sessao historica sem arquivo disponivel: mantem sem hash.
-                    continue
 
-            # Reclassifica historico existente para ligar modo assistido sem perder dados.
-            cur.execute("SELECT DISTINCT nome_key, campo FROM learned_pairs")
-            grupos = [(str(row[0]), str(row[1])) for row in cur.fetchall()]
-            agora = datetime.now().isoformat(timespec="seconds")
-            for nome_key, campo in grupos:
-                self._reclassificar_nome_campo(cur, nome_key, campo, agora)
+            # Reclassifica historico existente para ligar modo assistido sem
+            # perder dados: uma unica SELECT ordenada pelo indice cobridor
+            # alimenta a regra de confianca grupo a grupo e os novos status
+            # voltam ao banco num unico executemany (antes: uma SELECT e um
+            # ou dois UPDATEs por grupo distinto)
+            cur.execute(
+                """
+                SELECT nome_key, campo, documento, ocorrencias
+                FROM learned_pairs
+                ORDER BY nome_key, campo
+                """
+            )
+            status_rows: List[Tuple[str, str, str, str, str]] = []
+            for (nome_key, campo), linhas in itertools.groupby(
+                cur.fetchall(), key=lambda r: (str(r[0]), str(r[1]))
+            ):
+                campo_norm = self._normalizar_campo(campo)
+                if not campo_norm:
+                    continue
+                contagens = {str(r[2]): int(r[3] or 0) for r in linhas}
+                escolhido = self._selecionar_documento_por_confianca(contagens, campo=campo_norm)
+                for doc in contagens:
+                    if escolhido is None:
+                        status, motivo = self.STATUS_QUARENTENA, "baixa_confianca"
+                    elif doc == escolhido:
+                        status, motivo = self.STATUS_ATIVO, "confianca_suficiente"
+                    else:
+                        status, motivo = self.STATUS_QUARENTENA, "conflito_ou_baixa_confianca"
+                    status_rows.append((status, motivo, nome_key, campo, doc))
+            if status_rows:
+                cur.executemany(
+                    """
+                    UPDATE learned_pairs
+                    SET status = ?, status_motivo = ?
+                    WHERE nome_key = ? AND campo = ? AND documento = ?
+                    """,
+                    status_rows,
+                )
+            # Estatísticas atualizadas para o planejador escolher o índice
+            # cobridor em vez de varrer a tabela
+            cur.execute("ANALYZE")
             conn.commit()
 
     def _recarregar_cache(self) -> None:
         with self._lock:
-            nome_para_docs: Dict[str, Dict[str, Dict[str, object]]] = {}
-            doc_para_nomes: Dict[str, Dict[str, Dict[str, object]]] = {}
-            nome_para_docs_por_campo: Dict[str, Dict[str, Dict[str, Dict[str, object]]]] = {}
-            doc_para_nomes_por_campo: Dict[str, Dict[str, Dict[str, Dict[str, object]]]] = {}
+            # Guarda de quiescencia: uma agregacao barata resume o estado
+            # de learned_pairs (linhas, ocorrencias, ativos e ultima
+            # escrita); se bater com a da ultima reconstrucao, o banco nao
+            # mudou e as quatro estruturas seguem validas
+            with self._connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    """
+                    SELECT COUNT(*), COALESCE(SUM(ocorrencias), 0),
+                           SUM(CASE WHEN status = ? THEN 1 ELSE 0 END),
+                           COALESCE(MAX(ultima_ocorrencia), '')
+                    FROM learned_pairs
+                    """,
+                    (self.STATUS_ATIVO,),
+                )
+                fingerprint = tuple(cur.fetchone())
+            if fingerprint == self._cache_fingerprint:
+                return
+
+            nome_para_docs: Dict[str, Dict[str, int]] = {}
+            doc_para_nomes: Dict[str, Dict[str, Tuple[str, int]]] = {}
+            nome_para_docs_por_campo: Dict[str, Dict[str, Dict[str, int]]] = {}
+            doc_para_nomes_por_campo: Dict[str, Dict[str, Dict[str, Tuple[str, int]]]] = {}
             totais_status = {
                 self.STATUS_ATIVO: 0,
                 self.STATUS_QUARENTENA: 0,
@@ -835,67 +1149,187 @@ class AprendizadoStore:
 
             with self._connection() as conn:
                 cur = conn.cursor()
+                # Totais por status agregados pelo SQLite (coberto pelo
+                # indice de status), sem trazer cada linha para Python
+                cur.execute("SELECT status, COUNT(*) FROM learned_pairs GROUP BY status")
+                for row in cur.fetchall():
+                    status = self._normalizar_status(row[0])
+                    totais_status[status] = totais_status.get(status, 0) + int(row[1] or 0)
+
+                # Apenas pares ATIVOS participam da inferencia: o filtro no
+                # SQL reduz as linhas transferidas ao que o cache realmente usa
                 cur.execute(
                     """
-                    SELECT nome_key, documento, campo, nome_original, ocorrencias, status
+                    SELECT campo, nome_key, documento, nome_original, ocorrencias
                     FROM learned_pairs
-                    """
+                    WHERE status = ?
+                    """,
+                    (self.STATUS_ATIVO,),
                 )
-                for row in cur.fetchall():
-                    nome_key = str(row["nome_key"])
-                    doc = str(row["documento"])
-                    campo = self._normalizar_campo(str(row["campo"]))
-                    nome_original = str(row["nome_original"] or "").strip()
-                    total = int(row["ocorrencias"] or 0)
-                    status = self._normalizar_status(row["status"])
-
+                for campo_raw, nome_key, doc, nome_original, total in cur.fetchall():
+                    campo = self._normalizar_campo(str(campo_raw))
                     if not campo:
                         continue
+                    nome_key = str(nome_key)
+                    doc = str(doc)
+                    ocorrencias = int(total or 0)
+                    nome_para_docs_por_campo.setdefault(campo, {}).setdefault(
+                        nome_key, {}
+                    )[doc] = ocorrencias
+                    doc_para_nomes_por_campo.setdefault(campo, {}).setdefault(
+                        doc, {}
+                    )[nome_key] = (str(nome_original or "").strip(), ocorrencias)
+
+                # Cache global ja reduzido pelo GROUP BY: a soma entre campos
+                # acontece no SQLite, sem acumulacao setdefault/int no Python
+                cur.execute(
+                    """
+                    SELECT nome_key, documento, MAX(nome_original), SUM(ocorrencias)
+                    FROM learned_pairs
+                    WHERE status = ?
+                    GROUP BY nome_key, documento
+                    """,
+                    (self.STATUS_ATIVO,),
+                )
+                for nome_key, doc, nome_original, total in cur.fetchall():
+                    nome_key = str(nome_key)
+                    doc = str(doc)
+                    ocorrencias = int(total or 0)
+                    nome_para_docs.setdefault(nome_key, {})[doc] = ocorrencias
+                    doc_para_nomes.setdefault(doc, {})[nome_key] = (
+                        str(nome_original or "").strip(),
+                        ocorrencias,
+                    )
 
-                    totais_status[status] = totais_status.get(status, 0) + 1
+            self._nome_para_docs = nome_para_docs
+            self._doc_para_nomes = doc_para_nomes
+            self._nome_para_docs_por_campo = nome_para_docs_por_campo
+            self._doc_para_nomes_por_campo = doc_para_nomes_por_campo
+            self._totais_status = totais_status
+            self._cache_fingerprint = fingerprint
 
-                    # Apenas pares ATIVOS podem participar da inferencia automatica.
-                    if status != self.STATUS_ATIVO:
-                        continue
+    def _indexar_par_no_cache(
+        self,
+        nome_para_docs: Dict[str, Dict[str, int]],
+        doc_para_nomes: Dict[str, Dict[str, Tuple[str, int]]],
+        nome_para_docs_por_campo: Dict[str, Dict[str, Dict[str, int]]],
+        doc_para_nomes_por_campo: Dict[str, Dict[str, Dict[str, Tuple[str, int]]]],
+        totais_status: Optional[Dict[str, int]],
+        row: Tuple,
+    ) -> None:
+        """
+        Insere uma linha de learned_pairs nas quatro estruturas de cache.
 
-                    # Cache por campo (mais seguro para inferencia contextual)
-                    nome_para_docs_por_campo.setdefault(campo, {})
-                    nome_para_docs_por_campo[campo].setdefault(nome_key, {})
-                    nome_para_docs_por_campo[campo][nome_key][doc] = {
-                        "nome_original": nome_original,
-                        "ocorrencias": total,
-                    }
+        Recebe a tupla na ordem (nome_key, documento, campo, nome_original,
+        ocorrencias, status): o desempacotamento posicional evita a busca
+        por nome de coluna de sqlite3.Row, que varre a lista de nomes a
+        cada acesso (seis vezes por linha neste laco).
+        """
+        nome_key, doc, campo_raw, nome_original, total, status = row
+        nome_key = str(nome_key)
+        doc = str(doc)
+        campo = self._normalizar_campo(str(campo_raw))
+        nome_original = str(nome_original or "").strip()
+        total = int(total or 0)
+        status = self._normalizar_status(status)
+
+        if not campo:
+            return
 
-                    doc_para_nomes_por_campo.setdefault(campo, {})
-                    doc_para_nomes_por_campo[campo].setdefault(doc, {})
-                    doc_para_nomes_por_campo[campo][doc][nome_key] = {
-                        "nome_original": nome_original,
-                        "ocorrencias": total,
-                    }
+        if totais_status is not None:
+            totais_status[status] = totais_status.get(status, 0) + 1
 
-                    # Cache global (uso geral/retrocompatibilidade)
-                    nome_para_docs.setdefault(nome_key, {})
-                    if doc not in nome_para_docs[nome_key]:
-                        nome_para_docs[nome_key][doc] = {
-                            "nome_original": nome_original,
-                            "ocorrencias": 0,
-                        }
-                    nome_para_docs[nome_key][doc]["ocorrencias"] = int(
-                        nome_para_docs[nome_key][doc]["ocorrencias"]
-                    ) + total
-
-                    doc_para_nomes.setdefault(doc, {})
-                    if nome_key not in doc_para_nomes[doc]:
-                        doc_para_nomes[doc][nome_key] = {
-                            "nome_original": nome_original,
-                            "ocorrencias": 0,
-                        }
-                    doc_para_nomes[doc][nome_key]["ocorrencias"] = int(
-                        doc_para_nomes[doc][nome_key]["ocorrencias"]
-                    ) + total
+        # Apenas pares ATIVOS podem participar da inferencia automatica.
+        if status != self.STATUS_ATIVO:
+            return
 
-            self._nome_para_docs = nome_para_docs
-            self._doc_para_nomes = doc_para_nomes
-            self._nome_para_docs_por_campo = nome_para_docs_por_campo
-            self._doc_para_nomes_por_campo = doc_para_nomes_por_campo
+        # Cache por campo (mais seguro para inferencia contextual)
+        nome_para_docs_por_campo.setdefault(campo, {}).setdefault(nome_key, {})[doc] = total
+        doc_para_nomes_por_campo.setdefault(campo, {}).setdefault(doc, {})[nome_key] = (
+            nome_original,
+            total,
+        )
+
+        # Cache global (uso geral/retrocompatibilidade): soma entre campos e
+        # mantem o MAX(nome_original), igual ao GROUP BY da reconstrucao
+        docs = nome_para_docs.setdefault(nome_key, {})
+        docs[doc] = docs.get(doc, 0) + total
+
+        nomes = doc_para_nomes.setdefault(doc, {})
+        anterior = nomes.get(nome_key)
+        if anterior is None:
+            nomes[nome_key] = (nome_original, total)
+        else:
+            nomes[nome_key] = (max(anterior[0], nome_original), anterior[1] + total)
+
+    def _atualizar_cache_grupos(self, grupos: set) -> None:
+        """
+        Atualiza o cache apenas para os nomes tocados por um aprendizado.
+
+        Evita reconstruir as quatro estruturas inteiras (custo que cresce
+        com o banco) quando uma sessao altera poucos grupos.
+        """
+        nomes = sorted({nome_key for nome_key, _ in grupos})
+        if not nomes:
+            return
+
+        linhas: List[Tuple] = []
+        with self._connection() as conn:
+            cur = conn.cursor()
+            for inicio in range(0, len(nomes), 500):
+                lote = nomes[inicio:inicio + 500]
+                marcadores = ",".join("?" * len(lote))
+                cur.execute(
+                    f"""
+                    SELECT nome_key, documento, campo, nome_original, ocorrencias, status
+                    FROM learned_pairs
+                    WHERE nome_key IN ({marcadores})
+                    """,
+                    lote,
+                )
+                linhas.extend(cur.fetchall())
+            # Totais por status direto do banco: agregacao coberta pelo
+            # indice de status, mais barata que recontar o cache
+            cur.execute("SELECT status, COUNT(*) FROM learned_pairs GROUP BY status")
+            totais_rows = cur.fetchall()
+
+        with self._lock:
+            totais_status = {
+                self.STATUS_ATIVO: 0,
+                self.STATUS_QUARENTENA: 0,
+            }
+            for row in totais_rows:
+                status = self._normalizar_status(row[0])
+                totais_status[status] = totais_status.get(status, 0) + int(row[1] or 0)
             self._totais_status = totais_status
+
+            # Remove as entradas antigas dos nomes afetados (os documentos
+            # antigos saem dos indices invertidos antes da reinsercao)
+            for nome_key in nomes:
+                docs_antigos = self._nome_para_docs.pop(nome_key, {})
+                for doc in docs_antigos:
+                    nomes_doc = self._doc_para_nomes.get(doc)
+                    if nomes_doc is not None:
+                        nomes_doc.pop(nome_key, None)
+                        if not nomes_doc:
+                            self._doc_para_nomes.pop(doc, None)
+                for campo, por_nome in self._nome_para_docs_por_campo.items():
+                    docs_campo = por_nome.pop(nome_key, None)
+                    if docs_campo:
+                        por_doc = self._doc_para_nomes_por_campo.get(campo, {})
+                        for doc in docs_campo:
+                            entradas = por_doc.get(doc)
+                            if entradas is not None:
+                                entradas.pop(nome_key, None)
+                                if not entradas:
+                                    por_doc.pop(doc, None)
+
+            for row in linhas:
+                self._indexar_par_no_cache(
+                    self._nome_para_docs,
+                    self._doc_para_nomes,
+                    self._nome_para_docs_por_campo,
+                    self._doc_para_nomes_por_campo,
+                    None,
+                    row,
+                )
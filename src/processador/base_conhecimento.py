@@ -6,12 +6,20 @@ permitindo que o sistema preencha automaticamente campos faltantes
 quando o extrator de PDF falha em identificar o nome da empresa.
 """
 
+import functools
 import re
 import unicodedata
 from typing import Dict, Optional
 
 from .aprendizado_store import AprendizadoStore
 
+# Tabela de delecao para bytes.translate: a limpeza de CNPJ vira uma
+# unica passada em C por uma tabela de 256 entradas, sem a maquina de
+# estados do regex. Mantem apenas digitos ASCII: o resultado alimenta
+# int() no indice de chave inteira, que nao aceita digitos tipograficos
+# como o sobrescrito (que passam em str.isdigit)
+_DELETE_NAO_DIGITOS = bytes(i for i in range(256) if i not in b'0123456789')
+
 
 class BaseConhecimentoNomes:
     """
@@ -168,8 +176,28 @@ class BaseConhecimentoNomes:
         # (CPF em campo de CNPJ não passa na validação matemática).
     }
 
+    # Indice de consulta com chave inteira (CNPJ cabe em 64 bits): hash de
+    # int e uma operacao de CPU, contra o hash do string de 14 caracteres.
+    # Preenchido logo apos o corpo da classe e mantido em sincronia por
+    # adicionar_mapeamento; o dict original continua sendo a fonte de
+    # verdade (retorna as chaves com zeros a esquerda).
+    _MAPEAMENTO_INT: Dict[int, str] = {}
+
     _store_aprendizado: Optional[AprendizadoStore] = None
 
+    # Memoizado: o mesmo emitente/contratante se repete em dezenas de NFs
+    # do mesmo PDF, entao a limpeza roda uma vez por CNPJ distinto e as
+    # repeticoes viram um hit de cache (funcao pura, nao precisa de
+    # invalidacao)
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _limpar_cnpj(cnpj: str) -> str:
+        return (
+            cnpj.encode('latin-1', 'ignore')
+            .translate(None, _DELETE_NAO_DIGITOS)
+            .decode('latin-1')
+        )
+
     @classmethod
     def _obter_store_aprendizado(cls) -> Optional[AprendizadoStore]:
         """Obtém store de aprendizado sem interromper o fluxo em caso de falha."""
@@ -192,10 +220,12 @@ class BaseConhecimentoNomes:
             Nome da empresa se encontrado, None caso contrário
         """
         # Remove caracteres não numéricos para normalizar
-        cnpj_limpo = ''.join(filter(str.isdigit, cnpj))
-        
-        # Busca na base de conhecimento
-        nome = cls._MAPEAMENTO_CNPJ_NOMES.get(cnpj_limpo)
+        cnpj_limpo = cls._limpar_cnpj(str(cnpj or ''))
+        if not cnpj_limpo:
+            return None
+
+        # Busca na base de conhecimento (índice de chave inteira)
+        nome = cls._MAPEAMENTO_INT.get(int(cnpj_limpo))
         if nome:
             return nome
 
@@ -271,8 +301,10 @@ class BaseConhecimentoNomes:
         Returns:
             True se o CNPJ está na base, False caso contrário
         """
-        cnpj_limpo = ''.join(filter(str.isdigit, cnpj))
-        if cnpj_limpo in cls._MAPEAMENTO_CNPJ_NOMES:
+        cnpj_limpo = cls._limpar_cnpj(str(cnpj or ''))
+        if not cnpj_limpo:
+            return False
+        if int(cnpj_limpo) in cls._MAPEAMENTO_INT:
             return True
 
         store = cls._obter_store_aprendizado()
@@ -322,5 +354,17 @@ class BaseConhecimentoNomes:
             cnpj: CNPJ da empresa (será limpo automaticamente)
             nome: Nome completo da empresa
         """
-        cnpj_limpo = ''.join(filter(str.isdigit, cnpj))
-        cls._MAPEAMENTO_CNPJ_NOMES[cnpj_limpo] = nome.upper().strip()
+        cnpj_limpo = cls._limpar_cnpj(str(cnpj or ''))
+        if not cnpj_limpo:
+            return
+        nome_normalizado = nome.upper().strip()
+        cls._MAPEAMENTO_CNPJ_NOMES[cnpj_limpo] = nome_normalizado
+        cls._MAPEAMENTO_INT[int(cnpj_limpo)] = nome_normalizado
+
+
+# Indice inteiro construido uma vez no import (o corpo da classe nao pode
+# referenciar o proprio dicionario dentro de uma comprehension)
+BaseConhecimentoNomes._MAPEAMENTO_INT = {
+    int(cnpj): nome
+    for cnpj, nome in BaseConhecimentoNomes._MAPEAMENTO_CNPJ_NOMES.items()
+}
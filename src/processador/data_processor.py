@@ -8,6 +8,11 @@ from typing import List, Dict, Optional, Callable
 from ..gerador.validators import validar_cpf, validar_cnpj
 from .base_conhecimento import BaseConhecimentoNomes
 
+# Tabela de deleção para bytes.translate: varre a string num laço em C,
+# sem chamar str.isdigit caractere a caractere no interpretador
+# (chr(i).isdigit() reproduz o critério do antigo filter)
+_DELETE_NAO_DIGITOS = bytes(i for i in range(256) if not chr(i).isdigit())
+
 
 class SiproquimProcessor:
     """
@@ -47,7 +52,11 @@ class SiproquimProcessor:
     @staticmethod
     def _normalizar_documento(valor: object) -> str:
         texto = SiproquimProcessor._normalizar_texto(valor)
-        return ''.join(filter(str.isdigit, texto))
+        return (
+            texto.encode('latin-1', 'ignore')
+            .translate(None, _DELETE_NAO_DIGITOS)
+            .decode('latin-1')
+        )
     
     def filtrar_dados_validos(self, nfs_extraidas: List[Dict]) -> List[Dict]:
         """
@@ -59,20 +68,29 @@ class SiproquimProcessor:
         Returns:
             Lista com TODOS os registros (nada é removido, apenas corrigido ou avisado)
         """
-        nfs_finais: List[Dict] = []
+        # Nada é removido: o tamanho final é conhecido, então a lista é
+        # pré-alocada e preenchida por índice (sem os appends com
+        # redimensionamento geométrico)
+        nfs_finais: List[Dict] = [None] * len(nfs_extraidas)
         self.registros_corrigidos_count = 0
-        
+
         self._log_gui("INFO", f"Processando {len(nfs_extraidas)} registros com estratégia HÍBRIDA...")
-        
-        for nf in nfs_extraidas:
-            # 1. TENTA RESOLVER SOZINHO (Auto-correção)
-            self._tentar_corrigir_dados(nf)
-            
-            # 2. AUDITA O QUE RESTOU (Aponta erros para o humano)
-            self._auditar_para_humano(nf)
-            
+
+        for i, nf in enumerate(nfs_extraidas):
+            # Limpa cada CNPJ uma única vez por registro: correção e
+            # auditoria compartilham o resultado pela chave temporária
+            # (antes cada passe refazia a limpeza dos três campos)
+            nf['__cnpjs'] = {
+                chave: self._normalizar_documento(nf.get(chave, ''))
+                for chave in ('emitente_cnpj', 'contratante_cnpj', 'destinatario_cnpj')
+            }
+
+            # 1+2. CORRIGE E AUDITA numa unica passada pelos campos
+            self._processar_nf(nf)
+
             # 3. MANTÉM O REGISTRO (Não deleta nada)
-            nfs_finais.append(nf)
+            nf.pop('__cnpjs', None)
+            nfs_finais[i] = nf
         
         self._log_gui("INFO", f"Processamento finalizado.")
         self._log_gui("INFO", f" -> Corrigidos automaticamente: {self.registros_corrigidos_count}")
@@ -80,8 +98,18 @@ class SiproquimProcessor:
         
         return nfs_finais
     
-    def _tentar_corrigir_dados(self, nf: Dict) -> None:
-        """Tenta preencher nomes vazios usando a base de conhecimento."""
+    def _processar_nf(self, nf: Dict) -> None:
+        """
+        Corrige e audita uma NF numa única passada pelos campos.
+
+        Funde a auto-correção (base de conhecimento) com a auditoria:
+        cada campo é limpo e lido uma vez só, em vez de dois laços
+        separados varrendo os mesmos CNPJs e nomes. NÃO remove o
+        registro. Aponta EXATAMENTE onde está o problema.
+        """
+        cnpjs = nf['__cnpjs']
+        nf_num = nf.get('nf_numero', 'N/A')
+
         campos = [
             ('destinatario_cnpj', 'destinatario_nome', 'Destinatário'),
             ('contratante_cnpj', 'contratante_nome', 'Contratante'),
@@ -89,54 +117,37 @@ class SiproquimProcessor:
         ]
 
         for chave_cnpj, chave_nome, tipo_pessoa in campos:
-            cnpj = self._normalizar_documento(nf.get(chave_cnpj, ''))
+            cnpj = cnpjs[chave_cnpj]
             nome = self._normalizar_texto(nf.get(chave_nome, ''))
 
-            # Se tem CNPJ válido mas está sem nome
+            # AUTO-CORREÇÃO: tem CNPJ válido mas está sem nome
             if len(cnpj) == 14 and len(nome) < 2:
                 nome_base = BaseConhecimentoNomes.buscar_nome_por_cnpj(cnpj)
                 if nome_base:
                     nf[chave_nome] = nome_base
+                    nome = nome_base
                     self.registros_corrigidos_count += 1
-                    nf_num = nf.get('nf_numero', 'N/A')
                     self._log_gui("SUCESSO", f"NF {nf_num}: Auto-correção aplicada para CNPJ {cnpj} ({tipo_pessoa}) -> {nome_base}")
 
-    def _auditar_para_humano(self, nf: Dict) -> None:
-        """
-        Verifica problemas que o robô não conseguiu resolver e avisa o humano.
-        NÃO remove o registro. Aponta EXATAMENTE onde está o problema.
-        """
-        nf_num = nf.get('nf_numero', 'N/A')
-        
-        # --- VERIFICAÇÃO 1: CPF VÁLIDO EM CAMPO TN ---
-        for chave, tipo_pessoa in [('contratante_cnpj', 'Contratante'), ('destinatario_cnpj', 'Destinatário')]:
-            doc = self._normalizar_documento(nf.get(chave, ''))
-            
-            if len(doc) == 11 and validar_cpf(doc):
+            # VERIFICAÇÃO 1: CPF VÁLIDO EM CAMPO TN (só contratante e
+            # destinatário). O teste barato de tamanho vem antes:
+            # validar_cpf só roda para documentos de 11 dígitos
+            if chave_cnpj != 'emitente_cnpj' and len(cnpj) == 11 and validar_cpf(cnpj):
                 self._log_gui(
                     "INFO",
-                    f"NF {nf_num}: {tipo_pessoa} com CPF válido ({doc}) será exportado "
+                    f"NF {nf_num}: {tipo_pessoa} com CPF válido ({cnpj}) será exportado "
                     "no campo de 14 posições sem zero-fill."
                 )
 
-        # --- VERIFICAÇÃO 2: NOME AINDA VAZIO (Após tentativa de auto-correção) ---
-        campos_verificar = [
-            ('destinatario_cnpj', 'destinatario_nome', 'Destinatário'),
-            ('contratante_cnpj', 'contratante_nome', 'Contratante'),
-            ('emitente_cnpj', 'emitente_nome', 'Emitente')
-        ]
-        
-        for chave_cnpj, chave_nome, tipo_pessoa in campos_verificar:
-            nome = self._normalizar_texto(nf.get(chave_nome, ''))
-            cnpj = self._normalizar_documento(nf.get(chave_cnpj, ''))
-            
+            # VERIFICAÇÃO 2: NOME AINDA VAZIO (após tentativa de
+            # auto-correção). Sem CNPJ não há o que apontar.
             if cnpj and (not nome or len(nome) < 2):
                 self._log_gui("ATENCAO", f"NF {nf_num}: CNPJ {cnpj} ({tipo_pessoa}) está SEM NOME (não encontrado na base de conhecimento).")
                 self._log_gui("ATENCAO", f"   -> O registro foi mantido no TXT. Abra o arquivo gerado, procure por '{cnpj}' (ou NF {nf_num}) e preencha o nome da empresa manualmente.")
-        
+
         # --- VERIFICAÇÃO 3: CNPJ EMITENTE INVÁLIDO ---
-        cnpj_emitente = self._normalizar_documento(nf.get('emitente_cnpj', ''))
-        
+        cnpj_emitente = cnpjs['emitente_cnpj']
+
         if cnpj_emitente:
             if len(cnpj_emitente) != 14:
                 self._log_gui("ACAO_NECESSARIA", f"NF {nf_num}: CNPJ Emitente tem tamanho incorreto ({len(cnpj_emitente)} dígitos: {cnpj_emitente}).")
@@ -7,35 +7,13 @@ from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import QThread, Signal
-from unidecode import unidecode
 
 from main import ProcessamentoInterrompido, processar_pdf
 from src.gerador.layout_constants import mes_numero_para_alfanumerico
+from src.gui.utils import downloads_dir, gerar_nome_arquivo_saida
 from src.ui.logger import CentralLogsPainel, ContextoLinhaPainel
 
 
-def _downloads_dir() -> Path:
-    home = Path.home()
-    downloads = home / "Downloads"
-    return downloads if downloads.exists() else home
-
-
-def _gerar_nome_arquivo_saida(
-    ano: int,
-    mes_abreviado: str,
-    cnpj: str,
-    nome_pdf: str,
-) -> str:
-    nome_base = f"M{ano}{mes_abreviado.upper()}{cnpj}"
-    nome_sem_ext = Path(nome_pdf).stem
-    nome_sanitizado = unidecode(nome_sem_ext).upper()
-    nome_sanitizado = re.sub(r"[^A-Z0-9]", "_", nome_sanitizado)
-    nome_sanitizado = re.sub(r"_+", "_", nome_sanitizado).strip("_")
-    if len(nome_sanitizado) > 30:
-        nome_sanitizado = nome_sanitizado[:30]
-    return f"{nome_base}_{nome_sanitizado}.txt"
-
-
 class TrabalhadorExecucaoRpa(QThread):
     painel_limpo = Signal()
     status_alterado = Signal(str)
@@ -171,13 +149,13 @@ class TrabalhadorExecucaoRpa(QThread):
 
     def _resolver_caminho_saida(self) -> Path:
         mes_abreviado = mes_numero_para_alfanumerico(int(self.contexto_execucao["mes"]))
-        nome = _gerar_nome_arquivo_saida(
+        nome = gerar_nome_arquivo_saida(
             int(self.contexto_execucao["ano"]),
             mes_abreviado,
             str(self.contexto_execucao["cnpj"]),
             Path(self.contexto_execucao["pdf"]).name,
         )
-        return _downloads_dir() / nome
+        return downloads_dir() / nome
 
     def _processar_callback_backend(self, etapa: str, detalhes: dict) -> None:
         if etapa == "abrir":